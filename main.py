@@ -8,22 +8,28 @@ Usage:
   python main.py --output out.html       # save rendered HTML to file
   python main.py --save-json data.json   # save briefing JSON for debugging
   python main.py --pdf-output brief.pdf  # specify custom PDF output path
+  python main.py --prompt-cache          # cache the prompt for a quick rerun
 """
 import argparse
 import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to stdlib json
+    orjson = None
+
 # Make src importable when running from project root
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.aggregator import aggregate_news
-from src.summarizer import categorize_and_summarize
-from src.pdf_generator import generate_pdf
-from src.email_sender import send_briefing
+from src.summarizer import DEFAULT_MODEL, categorize_and_summarize
+from src.email_sender import render_briefing_html, send_briefing
 
 # ── Logging setup ────────────────────────────────────────────────────────────
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
@@ -72,8 +78,20 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--model",
         type=str,
-        default="claude-sonnet-4-5-20250929",
-        help="Claude model to use for summarization (default: claude-sonnet-4-5-20250929).",
+        default=os.environ.get("ANTHROPIC_MODEL", DEFAULT_MODEL),
+        help=f"Claude model to use for summarization (default: $ANTHROPIC_MODEL or {DEFAULT_MODEL}).",
+    )
+    parser.add_argument(
+        "--prompt-cache",
+        action="store_true",
+        help="Write the summarization prompt to Anthropic's 5-minute prompt cache; "
+             "only pays off when rerunning on the same stories straight away.",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Summarize via the Message Batches API (half price, slower; "
+             "also enabled by BRIEFING_BATCH=1).",
     )
     parser.add_argument(
         "--min-stories",
@@ -114,7 +132,12 @@ def main() -> int:
     # ── Step 2: Summarize with Claude ─────────────────────────────────────────
     logger.info("STEP 2/4 — Summarizing with Claude (%s)…", args.model)
     try:
-        briefing = categorize_and_summarize(news_items, model=args.model)
+        briefing = categorize_and_summarize(
+            news_items,
+            model=args.model,
+            prompt_cache=args.prompt_cache,
+            batch=args.batch or None,
+        )
     except Exception as exc:
         logger.error("Fatal error during summarization: %s", exc, exc_info=True)
         return 1
@@ -122,9 +145,14 @@ def main() -> int:
     # Optionally save the raw JSON
     if args.save_json:
         try:
-            Path(args.save_json).write_text(
-                json.dumps(briefing, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
+            if orjson is not None:
+                Path(args.save_json).write_bytes(
+                    orjson.dumps(briefing, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                Path(args.save_json).write_text(
+                    json.dumps(briefing, indent=2, ensure_ascii=False), encoding="utf-8"
+                )
             logger.info("Saved briefing JSON to %s", args.save_json)
         except Exception as exc:
             logger.warning("Could not save JSON: %s", exc)
@@ -138,12 +166,33 @@ def main() -> int:
 
     # ── Step 3: Generate PDF ───────────────────────────────────────────────────
     logger.info("STEP 3/4 — Generating premium PDF…")
-    try:
-        pdf_path = generate_pdf(briefing, output_path=args.pdf_output)
-        logger.info("PDF generated: %s", pdf_path)
-    except Exception as exc:
-        logger.error("Fatal error during PDF generation: %s", exc, exc_info=True)
-        return 1
+    # Imported here so runs that bail out before this step never load ReportLab
+    from src.pdf_generator import generate_pdf
+
+    # One timestamp for the HTML artifact and the email, so both show the same
+    # dates even when the run straddles midnight UTC
+    now = datetime.now(timezone.utc)
+
+    # The HTML artifact doesn't depend on the PDF, so render it alongside
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pdf_future = executor.submit(generate_pdf, briefing, output_path=args.pdf_output)
+        html_future = None
+        if args.output and not args.dry_run:
+            html_future = executor.submit(render_briefing_html, briefing, now)
+
+        try:
+            pdf_path = pdf_future.result()
+            logger.info("PDF generated: %s", pdf_path)
+        except Exception as exc:
+            logger.error("Fatal error during PDF generation: %s", exc, exc_info=True)
+            return 1
+
+        prerendered_html = None
+        if html_future:
+            try:
+                prerendered_html = html_future.result()
+            except Exception as exc:
+                logger.warning("Could not pre-render HTML: %s", exc)
 
     # ── Step 4: Send email (or dry run) ───────────────────────────────────────
     if args.dry_run:
@@ -160,7 +209,13 @@ def main() -> int:
     else:
         logger.info("STEP 4/4 — Sending email with PDF attachment…")
         try:
-            send_briefing(briefing, pdf_path=str(pdf_path), output_path=args.output)
+            send_briefing(
+                briefing,
+                pdf_path=str(pdf_path),
+                output_path=args.output,
+                prerendered_html=prerendered_html,
+                now=now,
+            )
         except Exception as exc:
             logger.error("Fatal error during email send: %s", exc, exc_info=True)
             return 1
@@ -1,45 +1,224 @@
 """
 News aggregator module - fetches AI and tech news from multiple sources.
 """
+import functools
+import json
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
 import re
 
 import feedparser
+import lxml.html
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to stdlib json
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
-def _age_days(published_parsed) -> float:
-    """Return how many days ago a feedparser time struct is."""
-    if not published_parsed:
-        return 0.0
-    pub_dt = datetime(*published_parsed[:6], tzinfo=timezone.utc)
-    return (datetime.now(timezone.utc) - pub_dt).total_seconds() / 86400
+@dataclass(slots=True, frozen=True)
+class NewsItem:
+    """A single aggregated story, as passed to the summarizer."""
+    title: str
+    url: str
+    summary: str
+    published: str
+    source: str
+
+
+_WS_RE = re.compile(r"\s+")
+
+USER_AGENT = "AI-News-Briefing/2.0 (+https://github.com/christrovato2000-stack/ai-news-briefing)"
+
+# On-disk HTTP cache (SQLite). Responses are revalidated with ETag /
+# Last-Modified, so unchanged feeds come back as a bodiless 304.
+HTTP_CACHE_PATH = Path(__file__).resolve().parent.parent / ".http_cache"
+
+
+def _make_session() -> requests.Session:
+    """Create a caching HTTP session with keep-alive connection pooling and retries."""
+    session = CachedSession(
+        cache_name=str(HTTP_CACHE_PATH),
+        backend="sqlite",
+        expire_after=1800,
+        cache_control=True,
+        stale_if_error=True,
+    )
+    # Up to 32 host pools with at most 6 connections each; pool_block makes
+    # extra concurrent requests to the same host wait for a free connection
+    # rather than opening throwaway ones.
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=6,
+        pool_block=True,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+# Shared across fetchers so repeated calls to the same host reuse connections
+_SESSION = _make_session()
+
+
+# ---------------------------------------------------------------------------
+# Feed parsing
+# ---------------------------------------------------------------------------
+
+_XML_PARSER = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+
+_FEED_ROOTS = {"rss", "RDF", "feed"}
+_ENTRY_TAGS = {"item", "entry"}
+_SUMMARY_TAGS = ("description", "summary", "encoded", "content")
+_DATE_TAGS = ("pubDate", "published", "date", "updated", "issued")
+
+
+def _local(el) -> str:
+    """Namespace-free tag name of an element ("" for comments/PIs)."""
+    return etree.QName(el).localname if isinstance(el.tag, str) else ""
+
 
+def _text(el) -> str:
+    """All text inside an element, or "" if it's missing."""
+    return "".join(el.itertext()).strip() if el is not None else ""
 
-def _fetch_feed(url: str, max_age_days: int = 7, limit: int = 20) -> list[dict]:
-    """Parse an RSS/Atom feed and return recent entries."""
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom, Dublin Core) timestamp as UTC."""
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _entry_link(children: dict) -> str:
+    link = children.get("link")
+    if link is None:
+        return ""
+    # Atom links carry the URL in href; RSS links carry it as text
+    return link.get("href") or _text(link)
+
+
+def _parse_feed(content: bytes) -> Optional[tuple[str, list[dict]]]:
+    """
+    Parse RSS 0.9x/1.0/2.0 or Atom XML with lxml.
+    Returns (feed_title, entries), or None if the document isn't a recognised feed.
+    """
     try:
-        feed = feedparser.parse(url)
-        if feed.bozo and feed.bozo_exception:
-            logger.warning("Feed parse warning for %s: %s", url, feed.bozo_exception)
+        root = etree.fromstring(content, parser=_XML_PARSER)
+    except etree.XMLSyntaxError:
+        return None
+    if root is None or _local(root) not in _FEED_ROOTS:
+        return None
+
+    channel = next((el for el in root if _local(el) == "channel"), root)
+    feed_title = _text(next((el for el in channel if _local(el) == "title"), None))
+
+    entries = []
+    for el in root.iter():
+        if _local(el) not in _ENTRY_TAGS:
+            continue
+        children: dict = {}
+        for child in el:
+            name = _local(child)
+            if name == "link" and child.get("rel", "alternate") == "alternate":
+                # Atom may list several links; the alternate one is the article
+                children[name] = child
+            else:
+                children.setdefault(name, child)
+        summary = next((children[t] for t in _SUMMARY_TAGS if t in children), None)
+        published = next((_text(children[t]) for t in _DATE_TAGS if t in children), "")
+        entries.append({
+            "title": _text(children.get("title")),
+            "link": _entry_link(children),
+            "summary": _text(summary),
+            "published": published,
+            "published_dt": _parse_date(published),
+        })
+    return feed_title, entries
+
+
+def _parse_feed_fallback(content: bytes, url: str) -> tuple[str, list[dict]]:
+    """Parse a feed lxml didn't recognise with feedparser."""
+    # Summaries are stripped to plain text by _clean_html and links are used
+    # verbatim, so skip feedparser's (pure-Python) sanitizer and URI resolver.
+    feed = feedparser.parse(content, sanitize_html=False, resolve_relative_uris=False)
+    if feed.bozo and feed.bozo_exception:
+        logger.warning("Feed parse warning for %s: %s", url, feed.bozo_exception)
+    entries = []
+    for entry in feed.entries:
+        parsed = getattr(entry, "published_parsed", None)
+        entries.append({
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "summary": entry.get("summary", entry.get("description", "")),
+            "published": entry.get("published", ""),
+            "published_dt": datetime(*parsed[:6], tzinfo=timezone.utc) if parsed else None,
+        })
+    return feed.feed.get("title", url), entries
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_feed_cached(url: str, content: bytes) -> tuple[str, tuple[dict, ...]]:
+    """
+    Parse a feed body, memoized per process on (url, body). Repeat fetches that
+    return identical XML (e.g. served from the HTTP cache) skip parsing.
+    Callers must treat the returned entries as read-only.
+    """
+    parsed = _parse_feed(content)
+    if parsed is None:
+        parsed = _parse_feed_fallback(content, url)
+    feed_title, entries = parsed
+    return feed_title, tuple(entries)
+
+
+def _fetch_feed(url: str, max_age_days: int = 7, limit: int = 20) -> list[NewsItem]:
+    """Fetch and parse an RSS/Atom feed and return recent entries."""
+    try:
+        resp = _SESSION.get(url, timeout=(3.05, 15))
+        resp.raise_for_status()
+        feed_title, entries = _parse_feed_cached(url, resp.content)
+
+        # Undated entries are treated as fresh
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
         items = []
-        for entry in feed.entries[:limit * 2]:
-            age = _age_days(getattr(entry, "published_parsed", None))
-            if age > max_age_days:
+        for entry in entries[:limit * 2]:
+            published = entry["published_dt"]
+            if published and published < cutoff:
                 continue
-            items.append({
-                "title": entry.get("title", "").strip(),
-                "url": entry.get("link", ""),
-                "summary": _clean_html(entry.get("summary", entry.get("description", ""))),
-                "published": entry.get("published", ""),
-                "source": feed.feed.get("title", url),
-            })
+            items.append(NewsItem(
+                title=entry["title"].strip(),
+                url=entry["link"],
+                summary=_clean_html(entry["summary"]),
+                published=entry["published"],
+                source=feed_title or url,
+            ))
             if len(items) >= limit:
                 break
         logger.info("Fetched %d items from %s", len(items), url)
@@ -53,15 +232,55 @@ def _clean_html(raw: str) -> str:
     """Strip HTML tags and collapse whitespace."""
     if not raw:
         return ""
-    text = BeautifulSoup(raw, "html.parser").get_text(separator=" ")
-    return re.sub(r"\s+", " ", text).strip()[:600]
+    if "<" not in raw and "&" not in raw:
+        # Plain-text summary — nothing to parse
+        return _WS_RE.sub(" ", raw).strip()[:600]
+    try:
+        text = " ".join(lxml.html.fromstring(raw).itertext())
+    except (etree.ParserError, ValueError):
+        text = BeautifulSoup(raw, "html.parser").get_text(separator=" ")
+    return _WS_RE.sub(" ", text).strip()[:600]
+
+
+def _keyword_pattern(keywords: set[str]) -> re.Pattern:
+    """Compile keywords into one case-insensitive whole-word regex (plurals allowed)."""
+    alternation = "|".join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+    return re.compile(rf"\b(?:{alternation})s?\b", re.IGNORECASE)
+
+
+def _matches(item: NewsItem, pattern: re.Pattern) -> bool:
+    """True if the item's title or summary mentions any keyword in the pattern."""
+    return bool(pattern.search(item.title) or pattern.search(item.summary))
 
 
 # ---------------------------------------------------------------------------
 # Hacker News
 # ---------------------------------------------------------------------------
 
-def fetch_hackernews(max_age_days: int = 7, limit: int = 30) -> list[dict]:
+def _hn_search_url(keyword: str, cutoff_ts: int) -> str:
+    """Build the HN Algolia search URL for a keyword since a unix timestamp."""
+    return (
+        "https://hn.algolia.com/api/v1/search?"
+        f"query={requests.utils.quote(keyword)}"
+        f"&tags=story"
+        f"&numericFilters=created_at_i>{cutoff_ts},points>10"
+        f"&hitsPerPage=15"
+    )
+
+
+def _fetch_hn_hits(keyword: str, cutoff_ts: int) -> list[dict]:
+    """Run a single HN Algolia search and return its raw hits."""
+    try:
+        resp = _SESSION.get(_hn_search_url(keyword, cutoff_ts), timeout=(3.05, 10))
+        resp.raise_for_status()
+        data = orjson.loads(resp.content) if orjson is not None else json.loads(resp.content)
+        return data.get("hits", [])
+    except Exception as exc:
+        logger.error("HN fetch error for '%s': %s", keyword, exc)
+        return []
+
+
+def fetch_hackernews(max_age_days: int = 7, limit: int = 30) -> list[NewsItem]:
     """Fetch top AI/tech stories from Hacker News Algolia API."""
     logger.info("Fetching Hacker News stories…")
     keywords = [
@@ -71,36 +290,35 @@ def fetch_hackernews(max_age_days: int = 7, limit: int = 30) -> list[dict]:
     ]
     cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
     cutoff_ts = int(cutoff.timestamp())
+    search_keywords = keywords[:6]  # limit API calls
 
-    results: list[dict] = []
+    # Searches are independent, so issue them concurrently; hits are merged
+    # in keyword order below so deduplication stays deterministic.
+    with ThreadPoolExecutor(max_workers=len(search_keywords)) as executor:
+        hit_lists = list(executor.map(
+            lambda kw: _fetch_hn_hits(kw, cutoff_ts), search_keywords
+        ))
+
+    results: list[NewsItem] = []
     seen: set[str] = set()
 
-    for kw in keywords[:6]:  # limit API calls
-        try:
-            url = (
-                "https://hn.algolia.com/api/v1/search?"
-                f"query={requests.utils.quote(kw)}"
-                f"&tags=story"
-                f"&numericFilters=created_at_i>{cutoff_ts},points>10"
-                f"&hitsPerPage=15"
+    for hits in hit_lists:
+        for hit in hits:
+            # Guard each hit: one malformed record shouldn't drop every HN story
+            object_id = hit.get("objectID")
+            story_url = hit.get("url") or (
+                f"https://news.ycombinator.com/item?id={object_id}" if object_id else ""
             )
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            for hit in resp.json().get("hits", []):
-                story_url = hit.get("url") or f"https://news.ycombinator.com/item?id={hit['objectID']}"
-                if story_url in seen:
-                    continue
-                seen.add(story_url)
-                results.append({
-                    "title": hit.get("title", "").strip(),
-                    "url": story_url,
-                    "summary": f"HN points: {hit.get('points', 0)} | comments: {hit.get('num_comments', 0)}",
-                    "published": hit.get("created_at", ""),
-                    "source": "Hacker News",
-                })
-        except Exception as exc:
-            logger.error("HN fetch error for '%s': %s", kw, exc)
-        time.sleep(0.3)
+            if not story_url or story_url in seen:
+                continue
+            seen.add(story_url)
+            results.append(NewsItem(
+                title=(hit.get("title") or "").strip(),
+                url=story_url,
+                summary=f"HN points: {hit.get('points', 0)} | comments: {hit.get('num_comments', 0)}",
+                published=hit.get("created_at", ""),
+                source="Hacker News",
+            ))
 
     # Sort by points proxy (embedded in summary) isn't ideal, just return as-is
     logger.info("Fetched %d unique HN stories", len(results))
@@ -111,7 +329,7 @@ def fetch_hackernews(max_age_days: int = 7, limit: int = 30) -> list[dict]:
 # ArXiv
 # ---------------------------------------------------------------------------
 
-def fetch_arxiv(max_age_days: int = 7, limit: int = 20) -> list[dict]:
+def fetch_arxiv(max_age_days: int = 7, limit: int = 20) -> list[NewsItem]:
     """Fetch recent AI papers from ArXiv RSS feeds."""
     logger.info("Fetching ArXiv papers…")
     feeds = [
@@ -119,14 +337,13 @@ def fetch_arxiv(max_age_days: int = 7, limit: int = 20) -> list[dict]:
         ("https://rss.arxiv.org/rss/cs.LG", "ArXiv cs.LG"),
         ("https://rss.arxiv.org/rss/cs.CL", "ArXiv cs.CL"),
     ]
-    all_items: list[dict] = []
+    all_items: list[NewsItem] = []
     seen: set[str] = set()
     for feed_url, label in feeds:
         for item in _fetch_feed(feed_url, max_age_days=max_age_days, limit=15):
-            if item["url"] not in seen:
-                item["source"] = label
-                all_items.append(item)
-                seen.add(item["url"])
+            if item.url not in seen:
+                all_items.append(replace(item, source=label))
+                seen.add(item.url)
     logger.info("Fetched %d ArXiv papers", len(all_items))
     return all_items[:limit]
 
@@ -135,7 +352,14 @@ def fetch_arxiv(max_age_days: int = 7, limit: int = 20) -> list[dict]:
 # TechCrunch AI
 # ---------------------------------------------------------------------------
 
-def fetch_techcrunch(max_age_days: int = 7, limit: int = 15) -> list[dict]:
+_TECHCRUNCH_AI_RE = _keyword_pattern({
+    "ai", "artificial intelligence", "machine learning", "openai", "anthropic",
+    "google deepmind", "llm", "chatgpt", "claude", "gemini", "gpt",
+    "deep learning", "neural", "robot", "robotics", "automation", "generative",
+})
+
+
+def fetch_techcrunch(max_age_days: int = 7, limit: int = 15) -> list[NewsItem]:
     """Fetch AI news from TechCrunch RSS."""
     logger.info("Fetching TechCrunch AI…")
     items = _fetch_feed(
@@ -143,15 +367,7 @@ def fetch_techcrunch(max_age_days: int = 7, limit: int = 15) -> list[dict]:
         max_age_days=max_age_days,
         limit=40,
     )
-    ai_keywords = {
-        "ai", "artificial intelligence", "machine learning", "openai", "anthropic",
-        "google deepmind", "llm", "chatgpt", "claude", "gemini", "gpt",
-        "deep learning", "neural", "robot", "automation", "generative",
-    }
-    filtered = [
-        i for i in items
-        if any(kw in i["title"].lower() or kw in i["summary"].lower() for kw in ai_keywords)
-    ]
+    filtered = [i for i in items if _matches(i, _TECHCRUNCH_AI_RE)]
     logger.info("Fetched %d TechCrunch AI items", len(filtered))
     return filtered[:limit]
 
@@ -160,7 +376,14 @@ def fetch_techcrunch(max_age_days: int = 7, limit: int = 15) -> list[dict]:
 # The Verge
 # ---------------------------------------------------------------------------
 
-def fetch_verge(max_age_days: int = 7, limit: int = 15) -> list[dict]:
+_VERGE_AI_RE = _keyword_pattern({
+    "ai", "artificial intelligence", "openai", "anthropic", "chatgpt",
+    "claude", "gemini", "llm", "machine learning", "deep learning",
+    "robot", "robotics", "automation", "generative", "gpt", "neural",
+})
+
+
+def fetch_verge(max_age_days: int = 7, limit: int = 15) -> list[NewsItem]:
     """Fetch AI coverage from The Verge RSS."""
     logger.info("Fetching The Verge AI…")
     items = _fetch_feed(
@@ -168,15 +391,7 @@ def fetch_verge(max_age_days: int = 7, limit: int = 15) -> list[dict]:
         max_age_days=max_age_days,
         limit=60,
     )
-    ai_keywords = {
-        "ai", "artificial intelligence", "openai", "anthropic", "chatgpt",
-        "claude", "gemini", "llm", "machine learning", "deep learning",
-        "robot", "automation", "generative", "gpt", "neural",
-    }
-    filtered = [
-        i for i in items
-        if any(kw in i["title"].lower() or kw in i["summary"].lower() for kw in ai_keywords)
-    ]
+    filtered = [i for i in items if _matches(i, _VERGE_AI_RE)]
     logger.info("Fetched %d Verge AI items", len(filtered))
     return filtered[:limit]
 
@@ -185,7 +400,14 @@ def fetch_verge(max_age_days: int = 7, limit: int = 15) -> list[dict]:
 # MIT Technology Review
 # ---------------------------------------------------------------------------
 
-def fetch_mit_tech_review(max_age_days: int = 7, limit: int = 10) -> list[dict]:
+_MIT_AI_RE = _keyword_pattern({
+    "ai", "artificial intelligence", "machine learning", "deep learning",
+    "neural", "llm", "robot", "robotics", "automation", "generative", "openai",
+    "anthropic", "chatgpt", "algorithm",
+})
+
+
+def fetch_mit_tech_review(max_age_days: int = 7, limit: int = 10) -> list[NewsItem]:
     """Fetch AI stories from MIT Technology Review RSS."""
     logger.info("Fetching MIT Tech Review…")
     items = _fetch_feed(
@@ -193,15 +415,7 @@ def fetch_mit_tech_review(max_age_days: int = 7, limit: int = 10) -> list[dict]:
         max_age_days=max_age_days,
         limit=30,
     )
-    ai_keywords = {
-        "ai", "artificial intelligence", "machine learning", "deep learning",
-        "neural", "llm", "robot", "automation", "generative", "openai",
-        "anthropic", "chatgpt", "algorithm",
-    }
-    filtered = [
-        i for i in items
-        if any(kw in i["title"].lower() or kw in i["summary"].lower() for kw in ai_keywords)
-    ]
+    filtered = [i for i in items if _matches(i, _MIT_AI_RE)]
     logger.info("Fetched %d MIT Tech Review items", len(filtered))
     return filtered[:limit]
 
@@ -210,7 +424,14 @@ def fetch_mit_tech_review(max_age_days: int = 7, limit: int = 10) -> list[dict]:
 # VentureBeat AI
 # ---------------------------------------------------------------------------
 
-def fetch_venturebeat(max_age_days: int = 7, limit: int = 15) -> list[dict]:
+_VENTUREBEAT_AI_RE = _keyword_pattern({
+    "ai", "artificial intelligence", "machine learning", "llm", "generative",
+    "openai", "anthropic", "deep learning", "neural", "robot", "robotics", "gpt",
+    "chatgpt", "claude", "gemini", "automation",
+})
+
+
+def fetch_venturebeat(max_age_days: int = 7, limit: int = 15) -> list[NewsItem]:
     """Fetch AI stories from VentureBeat RSS."""
     logger.info("Fetching VentureBeat AI…")
     items = _fetch_feed(
@@ -218,15 +439,7 @@ def fetch_venturebeat(max_age_days: int = 7, limit: int = 15) -> list[dict]:
         max_age_days=max_age_days,
         limit=40,
     )
-    ai_keywords = {
-        "ai", "artificial intelligence", "machine learning", "llm", "generative",
-        "openai", "anthropic", "deep learning", "neural", "robot", "gpt",
-        "chatgpt", "claude", "gemini", "automation",
-    }
-    filtered = [
-        i for i in items
-        if any(kw in i["title"].lower() or kw in i["summary"].lower() for kw in ai_keywords)
-    ]
+    filtered = [i for i in items if _matches(i, _VENTUREBEAT_AI_RE)]
     logger.info("Fetched %d VentureBeat items", len(filtered))
     return filtered[:limit]
 
@@ -235,7 +448,7 @@ def fetch_venturebeat(max_age_days: int = 7, limit: int = 15) -> list[dict]:
 # Wired AI
 # ---------------------------------------------------------------------------
 
-def fetch_wired(max_age_days: int = 7, limit: int = 10) -> list[dict]:
+def fetch_wired(max_age_days: int = 7, limit: int = 10) -> list[NewsItem]:
     """Fetch AI stories from Wired RSS."""
     logger.info("Fetching Wired AI…")
     items = _fetch_feed(
@@ -251,7 +464,25 @@ def fetch_wired(max_age_days: int = 7, limit: int = 10) -> list[dict]:
 # Main aggregation entry point
 # ---------------------------------------------------------------------------
 
-def aggregate_news(max_age_days: int = 7) -> list[dict]:
+_TRACKING_PARAMS = {"fbclid", "gclid", "ref", "ref_src"}
+
+
+def _url_key(url: str) -> str:
+    """
+    Canonical form of a story URL for deduplication: scheme, "www." prefix,
+    fragment, tracking parameters and trailing slash are ignored.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    path = parts.path.rstrip("/")
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith("utm_") and k not in _TRACKING_PARAMS
+    ])
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def aggregate_news(max_age_days: int = 7) -> list[NewsItem]:
     """
     Aggregate AI & tech news from all sources.
     Returns a deduplicated list of news items sorted with most recent first.
@@ -268,19 +499,34 @@ def aggregate_news(max_age_days: int = 7) -> list[dict]:
         fetch_wired,
     ]
 
-    all_items: list[dict] = []
+    all_items: list[NewsItem] = []
+    seen_urls: set[str] = set()
     seen_titles: set[str] = set()
 
-    for fetcher in fetchers:
-        try:
-            items = fetcher(max_age_days=max_age_days)
+    # Fetchers are I/O-bound, so run them concurrently. Results are merged in
+    # fetcher order (not completion order) so the output stays deterministic.
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = [
+            (fetcher, executor.submit(fetcher, max_age_days=max_age_days))
+            for fetcher in fetchers
+        ]
+        for fetcher, future in futures:
+            try:
+                items = future.result()
+            except Exception as exc:
+                logger.error("Fetcher %s failed: %s", fetcher.__name__, exc)
+                continue
             for item in items:
-                title_key = item["title"].lower().strip()
-                if title_key and title_key not in seen_titles:
-                    seen_titles.add(title_key)
-                    all_items.append(item)
-        except Exception as exc:
-            logger.error("Fetcher %s failed: %s", fetcher.__name__, exc)
+                title_key = item.title.lower().strip()
+                if not title_key or title_key in seen_titles:
+                    continue
+                url_key = _url_key(item.url) if item.url else ""
+                if url_key and url_key in seen_urls:
+                    continue
+                seen_titles.add(title_key)
+                if url_key:
+                    seen_urls.add(url_key)
+                all_items.append(item)
 
     logger.info("Aggregated %d unique stories total", len(all_items))
     return all_items
@@ -2,18 +2,26 @@
 Email sender module - renders the Jinja2 HTML template and sends via Gmail SMTP
 with the premium PDF briefing attached.
 """
+import atexit
+import base64
+import email.policy
+import functools
 import logging
 import os
 import smtplib
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from email.mime.application import MIMEApplication
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage, MIMEPart
 from pathlib import Path
 from typing import Optional
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,45 +36,114 @@ CATEGORY_ICONS = {
 }
 
 
-def _render_html(briefing: dict) -> str:
-    """Render the email HTML from the Jinja2 template."""
-    project_root = Path(__file__).resolve().parent.parent
-    template_dir = project_root / "src" / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465
+
+# English names for the fixed date formats below; strftime would follow the
+# process locale and take the locale lock on every call.
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Read size for attachments; a multiple of 57 bytes so each chunk encodes to
+# whole 76-character base64 lines.
+_B64_CHUNK = 57 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _get_environment() -> Environment:
+    """
+    Jinja2 environment for the bundled templates, created once per process.
+    Templates ship with the package and don't change at runtime, so skip the
+    per-render mtime checks and keep compiled bytecode in the user's temp
+    cache directory for later runs.
+    """
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
         autoescape=select_autoescape(["html"]),
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=FileSystemBytecodeCache(),
     )
-    template = env.get_template("email_template.html")
 
-    now = datetime.now(timezone.utc)
+
+@functools.lru_cache(maxsize=None)
+def _get_template(name: str):
+    """Load and compile a template once per process."""
+    return _get_environment().get_template(name)
+
+
+def _briefing_stats(briefing: dict) -> dict:
+    """Story, source and category counts shared by the email renderers."""
+    total = 0
+    sources = set()
+    non_empty = 0
+    for stories in briefing.get("categories", {}).values():
+        if stories:
+            non_empty += 1
+        total += len(stories)
+        sources.update(s.get("source", "Unknown") for s in stories)
+    return {
+        "total_stories": total,
+        "source_count": len(sources),
+        "category_count": non_empty,
+    }
+
+
+def _date_range(now: datetime) -> str:
+    """Human-readable span covering the seven days ending at now."""
     week_ago = now - timedelta(days=7)
-    date_range = f"{week_ago.strftime('%b %d')} – {now.strftime('%b %d, %Y')}"
+    return (
+        f"{_MONTHS[week_ago.month - 1][:3]} {week_ago.day:02d} – "
+        f"{_MONTHS[now.month - 1][:3]} {now.day:02d}, {now.year}"
+    )
+
+
+def _long_date(now: datetime) -> str:
+    """Date as "March 07, 2026" (strftime's "%B %d, %Y")."""
+    return f"{_MONTHS[now.month - 1]} {now.day:02d}, {now.year}"
+
+
+def _html_context(briefing: dict, stats: dict, now: datetime) -> dict:
+    """Template variables for the full HTML briefing."""
+    date_range = _date_range(now)
 
     categories = briefing.get("categories", {})
-    all_stories = [s for cat_stories in categories.values() for s in cat_stories]
-    sources = {s.get("source", "Unknown") for s in all_stories}
-    non_empty_cats = [c for c, stories in categories.items() if stories]
 
-    context = {
+    return {
         "date_range": date_range,
-        "total_stories": len(all_stories),
-        "source_count": len(sources),
-        "category_count": len(non_empty_cats),
+        **stats,
         "top_story_count": len(briefing.get("top_stories", [])),
         "executive_summary": briefing.get("executive_summary", ""),
         "top_stories": briefing.get("top_stories", []),
         "categories": categories,
         "category_icons": CATEGORY_ICONS,
-        "generated_at": now.strftime("%A, %B %d, %Y at %H:%M UTC"),
+        "generated_at": (
+            f"{_WEEKDAYS[now.weekday()]}, {_long_date(now)} "
+            f"at {now.hour:02d}:{now.minute:02d} UTC"
+        ),
     }
-    return template.render(**context)
+
+
+def _render_html(briefing: dict, stats: dict, now: datetime) -> str:
+    """Render the email HTML from the Jinja2 template."""
+    return _get_template("email_template.html").render(**_html_context(briefing, stats, now))
+
+
+def render_briefing_html(briefing: dict, now: Optional[datetime] = None) -> str:
+    """Render the full HTML briefing (the --output artifact) ahead of sending."""
+    return _render_html(briefing, _briefing_stats(briefing), now or datetime.now(timezone.utc))
 
 
 def _build_plain_text(briefing: dict, now: datetime) -> str:
     """Generate a plain-text fallback version of the briefing."""
     lines = [
         "AI & TECH WEEKLY BRIEFING",
-        f"Generated: {now.strftime('%B %d, %Y')}",
+        f"Generated: {_long_date(now)}",
         "=" * 60,
         "",
         "EXECUTIVE SUMMARY",
@@ -76,160 +153,210 @@ def _build_plain_text(briefing: dict, now: datetime) -> str:
         "TOP STORIES",
         "-" * 40,
     ]
-    for i, story in enumerate(briefing.get("top_stories", []), 1):
-        lines.append(f"{i}. {story.get('title', '')} [{story.get('source', '')}]")
-        lines.append(f"   {story.get('url', '')}")
-        lines.append(f"   {story.get('reason', '')}")
-        lines.append("")
+    # One pre-joined block per story (title, url, text, blank line), added a
+    # section at a time
+    lines.extend([
+        f"{i}. {story.get('title', '')} [{story.get('source', '')}]\n"
+        f"   {story.get('url', '')}\n"
+        f"   {story.get('reason', '')}\n"
+        for i, story in enumerate(briefing.get("top_stories", []), 1)
+    ])
 
     for category, stories in briefing.get("categories", {}).items():
         if not stories:
             continue
-        lines += ["", category.upper(), "-" * 40]
-        for story in stories:
-            lines.append(f"• {story.get('title', '')} [{story.get('source', '')}]")
-            lines.append(f"  {story.get('url', '')}")
-            lines.append(f"  {story.get('summary', '')}")
-            lines.append("")
+        lines.append(f"\n{category.upper()}\n{'-' * 40}")
+        lines.extend([
+            f"• {story.get('title', '')} [{story.get('source', '')}]\n"
+            f"  {story.get('url', '')}\n"
+            f"  {story.get('summary', '')}\n"
+            for story in stories
+        ])
 
     return "\n".join(lines)
 
 
-def _build_email_html(briefing: dict, date_range: str, pdf_filename: str) -> str:
+def _build_email_html(stats: dict, date_range: str, pdf_filename: str) -> str:
     """Build a simple, clean email body HTML for the PDF delivery email."""
-    categories = briefing.get("categories", {})
-    all_stories = [s for cat in categories.values() for s in cat]
-    sources = {s.get("source", "Unknown") for s in all_stories}
-    non_empty_cats = [c for c, stories in categories.items() if stories]
-    total = len(all_stories)
-    source_count = len(sources)
-    cat_count = len(non_empty_cats)
-
-    return f"""<!DOCTYPE html>
-<html>
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>AI & Tech Weekly Briefing</title>
-</head>
-<body style="margin:0;padding:0;background:#F3F4F6;font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Helvetica,Arial,sans-serif;">
-  <table width="100%" cellpadding="0" cellspacing="0" style="background:#F3F4F6;padding:32px 16px;">
-    <tr><td align="center">
-      <table width="560" cellpadding="0" cellspacing="0" style="max-width:560px;width:100%;">
-
-        <!-- Header -->
-        <tr>
-          <td style="background:linear-gradient(135deg,#0D1B2A,#1B0D2A);border-radius:12px 12px 0 0;padding:32px 36px;text-align:center;">
-            <div style="font-size:13px;font-weight:600;color:#94A3B8;text-transform:uppercase;letter-spacing:2px;margin-bottom:8px;">Weekly Briefing</div>
-            <div style="font-size:28px;font-weight:800;color:#FFFFFF;margin-bottom:6px;">AI &amp; Tech</div>
-            <div style="font-size:14px;color:#CBD5E1;">{date_range}</div>
-          </td>
-        </tr>
-
-        <!-- Stats bar -->
-        <tr>
-          <td style="background:#1E293B;padding:16px 36px;">
-            <table width="100%" cellpadding="0" cellspacing="0">
-              <tr>
-                <td style="text-align:center;border-right:1px solid #334155;">
-                  <div style="font-size:24px;font-weight:800;color:#F59E0B;">{total}</div>
-                  <div style="font-size:11px;color:#94A3B8;margin-top:2px;">Stories</div>
-                </td>
-                <td style="text-align:center;border-right:1px solid #334155;">
-                  <div style="font-size:24px;font-weight:800;color:#F59E0B;">{source_count}</div>
-                  <div style="font-size:11px;color:#94A3B8;margin-top:2px;">Sources</div>
-                </td>
-                <td style="text-align:center;">
-                  <div style="font-size:24px;font-weight:800;color:#F59E0B;">{cat_count}</div>
-                  <div style="font-size:11px;color:#94A3B8;margin-top:2px;">Categories</div>
-                </td>
-              </tr>
-            </table>
-          </td>
-        </tr>
-
-        <!-- Body -->
-        <tr>
-          <td style="background:#FFFFFF;padding:32px 36px;">
-            <p style="margin:0 0 16px;font-size:16px;font-weight:600;color:#111827;">
-              Your weekly briefing is attached. 📎
-            </p>
-            <p style="margin:0 0 20px;font-size:14px;color:#4B5563;line-height:1.7;">
-              This week's <strong>AI &amp; Tech Weekly Briefing</strong> covers {date_range} with
-              <strong>{total} stories</strong> from <strong>{source_count} sources</strong>
-              across <strong>{cat_count} categories</strong>.
-            </p>
-
-            <!-- PDF callout box -->
-            <table width="100%" cellpadding="0" cellspacing="0" style="background:#EEF2FF;border-radius:8px;border:1px solid #C7D2FE;margin-bottom:24px;">
-              <tr>
-                <td style="padding:16px 20px;">
-                  <div style="font-size:13px;font-weight:700;color:#3730A3;margin-bottom:4px;">📄 {pdf_filename}</div>
-                  <div style="font-size:12px;color:#6366F1;">Open the attached PDF for your full curated weekly briefing with clickable links.</div>
-                </td>
-              </tr>
-            </table>
-
-            <p style="margin:0;font-size:13px;color:#9CA3AF;">
-              This is an automated briefing. Curated by Claude AI, delivered via GitHub Actions.
-            </p>
-          </td>
-        </tr>
-
-        <!-- Footer -->
-        <tr>
-          <td style="background:#F9FAFB;border-radius:0 0 12px 12px;padding:16px 36px;border-top:1px solid #E5E7EB;">
-            <p style="margin:0;font-size:11px;color:#9CA3AF;text-align:center;">
-              AI &amp; Tech Weekly Briefing &nbsp;•&nbsp; Curated by Claude AI &nbsp;•&nbsp; Powered by GitHub Actions
-            </p>
-          </td>
-        </tr>
-
-      </table>
-    </td></tr>
-  </table>
-</body>
-</html>"""
+    return _get_template("email_body.html").render(
+        date_range=date_range,
+        pdf_filename=pdf_filename,
+        **stats,
+    )
 
 
-def send_briefing(
+# Renders kept for re-sends of the same briefing (e.g. a caller retrying after
+# an SMTP failure), keyed by briefing["version"] or the briefing's id. Each
+# entry holds a reference to its briefing, so an id can't be reused while
+# cached.
+_RENDER_CACHE_SIZE = 4
+_render_cache: dict = {}
+
+
+def _get_renders(
     briefing: dict,
-    pdf_path: Optional[str] = None,
-    recipient_email: Optional[str] = None,
-    sender_email: Optional[str] = None,
-    gmail_app_password: Optional[str] = None,
-    output_path: Optional[str] = None,
-    max_retries: int = 3,
-) -> None:
+    use_cache: bool = True,
+    now: Optional[datetime] = None,
+) -> dict:
     """
-    Render the briefing and send it via Gmail SMTP with PDF attached.
+    Timestamp, stats, plain text and email HTML bodies for a briefing,
+    reused from an earlier send unless use_cache is False or a different
+    timestamp is requested.
+    """
+    version = briefing.get("version")
+    key = ("version", version) if version is not None else ("id", id(briefing))
+    renders = _render_cache.get(key) if use_cache else None
+    if renders is not None and now is not None and renders["now"] != now:
+        renders = None
+    if renders is None:
+        now = now or datetime.now(timezone.utc)
+        renders = {
+            "briefing": briefing,
+            "now":      now,
+            "stats":    _briefing_stats(briefing),
+            "plain":    _build_plain_text(briefing, now),
+            # Email HTML bodies, keyed by the attachment filename they name
+            "email_html": {},
+        }
+        _render_cache.pop(key, None)
+        _render_cache[key] = renders
+        while len(_render_cache) > _RENDER_CACHE_SIZE:
+            del _render_cache[next(iter(_render_cache))]
+    return renders
+
+
+def _save_html(output_path: str, html: Optional[str], renders: dict) -> None:
+    """
+    Write the HTML artifact, logging rather than raising on failure. Without
+    pre-rendered html the template is streamed straight to the file, so the
+    whole document is never held in memory as a string and again as bytes.
+    """
+    try:
+        if html is not None:
+            Path(output_path).write_text(html, encoding="utf-8")
+        else:
+            context = _html_context(renders["briefing"], renders["stats"], renders["now"])
+            _get_template("email_template.html").stream(**context).dump(
+                output_path, encoding="utf-8"
+            )
+        logger.info("Saved rendered HTML to %s", output_path)
+    except Exception as exc:
+        logger.warning("Could not save HTML: %s", exc)
 
-    Args:
-        briefing: Structured briefing dict from summarizer
-        pdf_path: Path to the generated PDF file to attach
-        recipient_email: Override recipient (falls back to RECIPIENT_EMAIL env var)
-        sender_email: Override sender (falls back to SENDER_EMAIL env var)
-        gmail_app_password: Override password (falls back to GMAIL_APP_PASSWORD env var)
-        output_path: If set, also save the rendered HTML to this path
-        max_retries: Number of SMTP send attempts with exponential backoff
+
+def _smtp_connect(user: str, password: str) -> smtplib.SMTP_SSL:
+    """Open an authenticated Gmail SMTP connection."""
+    server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT)
+    try:
+        server.login(user, password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _smtp_close(server: Optional[smtplib.SMTP_SSL]) -> None:
+    """Politely close an SMTP connection, ignoring errors from a dead socket."""
+    if server is None:
+        return
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+# Logged-in connections kept open between sends, keyed by login user
+_smtp_pool: dict[str, smtplib.SMTP_SSL] = {}
+
+
+def _get_smtp(user: str, password: str) -> smtplib.SMTP_SSL:
+    """Return a pooled connection for user, reconnecting if it has gone stale."""
+    server = _smtp_pool.pop(user, None)
+    if server is not None:
+        try:
+            if server.noop()[0] == 250:
+                _smtp_pool[user] = server
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        _smtp_close(server)
+    server = _smtp_connect(user, password)
+    _smtp_pool[user] = server
+    return server
+
+
+def close_smtp_connections() -> None:
+    """Close every pooled SMTP connection opened with keep_alive=True."""
+    while _smtp_pool:
+        _, server = _smtp_pool.popitem()
+        _smtp_close(server)
+
+
+atexit.register(close_smtp_connections)
+
+
+def _pdf_attachment(pdf_file: Path, filename: str) -> MIMEPart:
+    """
+    Build a base64 PDF attachment, encoding the file chunk by chunk so the raw
+    bytes are never held whole; the encoded chunks are joined once.
+    """
+    parts = []
+    with open(pdf_file, "rb") as f:
+        while chunk := f.read(_B64_CHUNK):
+            parts.append(base64.encodebytes(chunk).decode("ascii"))
+
+    attachment = MIMEPart()
+    attachment["Content-Type"] = "application/pdf"
+    attachment["Content-Transfer-Encoding"] = "base64"
+    attachment.set_payload("".join(parts))
+    del parts
+    attachment.add_header("Content-Disposition", "attachment", filename=filename)
+    return attachment
+
+
+def _resolve_credentials(
+    recipients,
+    sender_email: Optional[str],
+    gmail_app_password: Optional[str],
+    recipient_name: str = "RECIPIENT_EMAIL",
+) -> tuple:
+    """
+    Fill sender and password from the environment and check nothing is
+    missing, before any rendering or network work happens.
+
+    Returns (recipients, from_addr, password); raises ValueError naming every
+    missing setting.
     """
-    to_addr  = recipient_email    or os.environ.get("RECIPIENT_EMAIL")
     from_addr = sender_email      or os.environ.get("SENDER_EMAIL")
     password  = gmail_app_password or os.environ.get("GMAIL_APP_PASSWORD")
 
-    if not all([to_addr, from_addr, password]):
+    if not all([recipients, from_addr, password]):
         missing = [
             name for name, val in [
-                ("RECIPIENT_EMAIL",    to_addr),
+                (recipient_name,       recipients),
                 ("SENDER_EMAIL",       from_addr),
                 ("GMAIL_APP_PASSWORD", password),
             ] if not val
         ]
         raise ValueError(f"Missing email configuration: {', '.join(missing)}")
+    return recipients, from_addr, password
 
-    now = datetime.now(timezone.utc)
-    week_ago = now - timedelta(days=7)
-    date_range = f"{week_ago.strftime('%b %d')} – {now.strftime('%b %d, %Y')}"
+
+def _build_message_bytes(
+    renders: dict,
+    from_addr: str,
+    pdf_path: Optional[str],
+) -> bytes:
+    """
+    Build and flatten the briefing email without a To header.
+
+    The same bytes are shared by every recipient; _address_to prepends the
+    per-recipient header. Only the text bodies come from the render cache:
+    the PDF is read afresh on every call, so a file regenerated at the same
+    path is never sent stale and no attachment outlives the send.
+    """
+    now = renders["now"]
+    date_range = _date_range(now)
 
     # Validate PDF before building the message
     pdf_file = Path(pdf_path) if pdf_path else None
@@ -237,79 +364,243 @@ def send_briefing(
         logger.warning("PDF file not found at %s — sending without attachment", pdf_file)
         pdf_file = None
 
-    pdf_filename = pdf_file.name if pdf_file else f"AI-Tech-Briefing-{now.strftime('%Y-%m-%d')}.pdf"
-
-    # Build subject
-    subject = f"AI & Tech Weekly Briefing — {date_range}"
+    pdf_filename = pdf_file.name if pdf_file else f"AI-Tech-Briefing-{now.date().isoformat()}.pdf"
 
     # Build message
-    msg = MIMEMultipart("mixed")
-    msg["Subject"] = subject
+    msg = EmailMessage()
+    msg["Subject"] = f"AI & Tech Weekly Briefing — {date_range}"
     msg["From"]    = f"AI News Briefing <{from_addr}>"
-    msg["To"]      = to_addr
     msg["X-Mailer"] = "AI-News-Briefing/2.0"
 
     # Multipart/alternative for plain + HTML body
-    body_part = MIMEMultipart("alternative")
-
-    plain_text = _build_plain_text(briefing, now)
-    body_part.attach(MIMEText(plain_text, "plain", "utf-8"))
-
-    html_body = _build_email_html(briefing, date_range, pdf_filename)
-    body_part.attach(MIMEText(html_body, "html", "utf-8"))
-
-    msg.attach(body_part)
-
-    # Optionally save HTML for debugging
-    if output_path:
-        try:
-            # Also render the full Jinja2 template for the HTML artifact
-            full_html = _render_html(briefing)
-            Path(output_path).write_text(full_html, encoding="utf-8")
-            logger.info("Saved rendered HTML to %s", output_path)
-        except Exception as exc:
-            logger.warning("Could not save HTML: %s", exc)
+    msg.set_content(renders["plain"])
+    email_html = renders["email_html"].get(pdf_filename)
+    if email_html is None:
+        email_html = renders["email_html"][pdf_filename] = _build_email_html(
+            renders["stats"], date_range, pdf_filename
+        )
+    msg.add_alternative(email_html, subtype="html")
 
     # Attach PDF
     if pdf_file:
-        logger.info("Attaching PDF: %s (%.1f KB)", pdf_filename,
-                    pdf_file.stat().st_size / 1024)
-        with open(pdf_file, "rb") as f:
-            pdf_data = f.read()
-        pdf_attachment = MIMEApplication(pdf_data, _subtype="pdf")
-        pdf_attachment.add_header(
-            "Content-Disposition", "attachment", filename=pdf_filename
-        )
-        msg.attach(pdf_attachment)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Attaching PDF: %s (%.1f KB)", pdf_filename,
+                         pdf_file.stat().st_size / 1024)
+        msg.make_mixed()
+        msg.attach(_pdf_attachment(pdf_file, pdf_filename))
     else:
         logger.warning("No PDF attached — sending email body only.")
 
-    # Send with retry logic
-    logger.info("Sending email to %s…", to_addr)
+    # Serialize once with SMTP line endings; reused across retries and recipients
+    return msg.as_bytes(policy=msg.policy.clone(linesep="\r\n"))
+
+
+def _address_to(msg_bytes: bytes, to_addr: str) -> bytes:
+    """Prepend a To header to a message flattened by _build_message_bytes."""
+    return email.policy.SMTP.fold_binary("To", to_addr) + msg_bytes
+
+
+def _save_html_async(
+    renders: dict,
+    output_path: Optional[str],
+    prerendered_html: Optional[str],
+) -> Optional[Future]:
+    """
+    Start rendering and writing the HTML artifact on a worker thread so it
+    overlaps the SMTP connect and login.
+    """
+    if not output_path:
+        return None
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(_save_html, output_path, prerendered_html, renders)
+    executor.shutdown(wait=False)
+    return future
+
+
+def _deliver(
+    from_addr: str,
+    password: str,
+    to_addr: str,
+    msg_bytes: bytes,
+    max_retries: int,
+    keep_alive: bool,
+    server: Optional[smtplib.SMTP_SSL] = None,
+) -> None:
+    """
+    Send pre-flattened message bytes with retry logic. The connection (an
+    already logged-in server if given) is kept open across retries and only
+    re-established when the server drops it.
+    """
+    logger.debug("Sending email to %s…", to_addr)
+    connect = _get_smtp if keep_alive else _smtp_connect
     last_exc = None
-    for attempt in range(1, max_retries + 1):
-        try:
-            with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-                server.login(from_addr, password)
-                server.sendmail(from_addr, to_addr, msg.as_string())
-            logger.info("Email sent successfully to %s (attempt %d)", to_addr, attempt)
-            return
-        except smtplib.SMTPAuthenticationError as exc:
-            logger.error(
-                "Gmail authentication failed. "
-                "Use an App Password (16 chars), NOT your regular Gmail password. "
-                "Error: %s", exc
-            )
-            raise  # Auth errors won't be fixed by retrying
-        except smtplib.SMTPException as exc:
-            last_exc = exc
-            if attempt < max_retries:
-                wait = 2 ** attempt
-                logger.warning("SMTP error (attempt %d/%d): %s — retrying in %ds",
-                               attempt, max_retries, exc, wait)
-                time.sleep(wait)
-            else:
-                logger.error("SMTP error after %d attempts: %s", max_retries, exc)
+    try:
+        for attempt in range(1, max_retries + 1):
+            try:
+                if server is None:
+                    server = connect(from_addr, password)
+                server.sendmail(from_addr, to_addr, msg_bytes)
+                logger.info("Email sent successfully to %s (attempt %d)", to_addr, attempt)
+                return
+            except smtplib.SMTPAuthenticationError as exc:
+                logger.error(
+                    "Gmail authentication failed. "
+                    "Use an App Password (16 chars), NOT your regular Gmail password. "
+                    "Error: %s", exc
+                )
+                raise  # Auth errors won't be fixed by retrying
+            except smtplib.SMTPException as exc:
+                last_exc = exc
+                if isinstance(exc, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+                    if keep_alive:
+                        _smtp_pool.pop(from_addr, None)
+                    _smtp_close(server)
+                    server = None
+                if attempt < max_retries:
+                    wait = 2 ** attempt
+                    logger.warning("SMTP error (attempt %d/%d): %s — retrying in %ds",
+                                   attempt, max_retries, exc, wait)
+                    time.sleep(wait)
+                else:
+                    logger.error("SMTP error after %d attempts: %s", max_retries, exc)
+    finally:
+        if not keep_alive:
+            _smtp_close(server)
 
     if last_exc:
         raise last_exc
+
+
+def send_briefing(
+    briefing: dict,
+    pdf_path: Optional[str] = None,
+    recipient_email: Optional[str] = None,
+    sender_email: Optional[str] = None,
+    gmail_app_password: Optional[str] = None,
+    output_path: Optional[str] = None,
+    max_retries: int = 3,
+    prerendered_html: Optional[str] = None,
+    keep_alive: bool = False,
+    dry_run: bool = False,
+    render_after_auth: bool = False,
+    render_cache: bool = True,
+    now: Optional[datetime] = None,
+) -> None:
+    """
+    Render the briefing and send it via Gmail SMTP with PDF attached.
+
+    Args:
+        briefing: Structured briefing dict from summarizer
+        pdf_path: Path to the generated PDF file to attach
+        recipient_email: Override recipient (falls back to RECIPIENT_EMAIL env var)
+        sender_email: Override sender (falls back to SENDER_EMAIL env var)
+        gmail_app_password: Override password (falls back to GMAIL_APP_PASSWORD env var)
+        output_path: If set, also save the rendered HTML to this path
+        max_retries: Number of SMTP send attempts with exponential backoff
+        prerendered_html: Output of render_briefing_html, if already rendered;
+            saved to output_path instead of rendering the template again
+        keep_alive: Leave the logged-in SMTP connection open for later sends
+            (closed by close_smtp_connections or at interpreter exit)
+        dry_run: Build the message (and HTML artifact) but don't connect to SMTP
+        render_after_auth: Log in before rendering, so bad credentials fail
+            without paying for the render
+        render_cache: Reuse the rendering from an earlier send of this
+            briefing (matched by briefing["version"] or identity); pass False
+            after mutating the briefing to render it afresh
+        now: Timestamp for the subject and bodies (default: the current
+            time); pass the one given to render_briefing_html to keep the
+            dates in the email and the HTML artifact in step
+    """
+    to_addr, from_addr, password = _resolve_credentials(
+        recipient_email or os.environ.get("RECIPIENT_EMAIL"),
+        sender_email,
+        gmail_app_password,
+    )
+
+    server = None
+    if render_after_auth and not dry_run:
+        server = (_get_smtp if keep_alive else _smtp_connect)(from_addr, password)
+
+    try:
+        # One clock read for the subject, bodies and HTML artifact
+        renders = _get_renders(briefing, render_cache, now)
+        msg_bytes = _address_to(
+            _build_message_bytes(renders, from_addr, pdf_path), to_addr
+        )
+    except Exception:
+        if not keep_alive:
+            _smtp_close(server)
+        raise
+
+    save_future = _save_html_async(renders, output_path, prerendered_html)
+    try:
+        if dry_run:
+            logger.info("Dry run — not sending email to %s", to_addr)
+            return
+        _deliver(from_addr, password, to_addr, msg_bytes, max_retries, keep_alive, server)
+    finally:
+        if save_future is not None:
+            save_future.result()
+
+
+def send_briefings(
+    briefings: list[dict],
+    recipients: list[str],
+    pdf_paths: Optional[list[Optional[str]]] = None,
+    sender_email: Optional[str] = None,
+    gmail_app_password: Optional[str] = None,
+    max_retries: int = 3,
+    render_cache: bool = True,
+    now: Optional[datetime] = None,
+) -> None:
+    """
+    Send every briefing to every recipient over one logged-in SMTP
+    connection. Each briefing is rendered and flattened once; only the To
+    header differs between recipients.
+
+    Args:
+        briefings: Structured briefing dicts from summarizer
+        recipients: Addresses to send each briefing to
+        pdf_paths: PDF to attach to each briefing, in the same order
+            (default: none attached)
+        sender_email, gmail_app_password, max_retries, render_cache, now:
+            As for send_briefing
+
+    A failed send doesn't stop the rest; every failure is logged and one
+    SMTPException naming them is raised once all sends have been tried.
+    Authentication errors are raised straight away, as no later send could
+    succeed.
+    """
+    recipients, from_addr, password = _resolve_credentials(
+        recipients, sender_email, gmail_app_password, recipient_name="recipients"
+    )
+    if pdf_paths is None:
+        pdf_paths = [None] * len(briefings)
+    elif len(pdf_paths) != len(briefings):
+        raise ValueError(
+            f"Got {len(pdf_paths)} PDF paths for {len(briefings)} briefings"
+        )
+
+    failures = []
+    try:
+        for briefing, pdf_path in zip(briefings, pdf_paths):
+            renders = _get_renders(briefing, render_cache, now)
+            body_bytes = _build_message_bytes(renders, from_addr, pdf_path)
+            for to_addr in recipients:
+                try:
+                    _deliver(from_addr, password, to_addr, _address_to(body_bytes, to_addr),
+                             max_retries, keep_alive=True)
+                except smtplib.SMTPAuthenticationError:
+                    raise
+                except (smtplib.SMTPException, OSError) as exc:
+                    logger.error("Could not send briefing to %s: %s", to_addr, exc)
+                    failures.append((to_addr, exc))
+    finally:
+        # Only this sender's connection; other keep_alive callers keep theirs
+        _smtp_close(_smtp_pool.pop(from_addr, None))
+
+    if failures:
+        raise smtplib.SMTPException(
+            f"Failed {len(failures)} of {len(briefings) * len(recipients)} sends: "
+            + "; ".join(f"{to_addr}: {exc}" for to_addr, exc in failures)
+        ) from failures[0][1]
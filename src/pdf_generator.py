@@ -2,16 +2,22 @@
 PDF Generator - produces a premium, McKinsey-meets-Morning-Brew style
 AI & Tech Weekly Briefing PDF using ReportLab.
 """
+import contextlib
+import functools
+import io
 import logging
 import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
+from xml.sax.saxutils import escape
 
+from reportlab import rl_config
+from reportlab.graphics.shapes import Drawing, Line, Rect, String
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.utils import ImageReader
 from reportlab.platypus import (
@@ -28,13 +34,30 @@ from reportlab.platypus import (
     Table,
     TableStyle,
 )
-from reportlab.platypus.flowables import Flowable
+from reportlab.platypus.flowables import BalancedColumns, Flowable
 from reportlab.lib.colors import HexColor, Color
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfgen.pathobject import PDFPathObject
 
 logger = logging.getLogger(__name__)
 
+
+@contextlib.contextmanager
+def _raw_binary_streams():
+    """
+    Write compressed streams as raw binary while building our PDFs. The
+    default ASCII85 wrapping only matters for 7-bit transports and inflates
+    every stream by a quarter; rl_config is process-wide, so the previous
+    setting is restored for other ReportLab users afterwards.
+    """
+    previous = rl_config.useA85
+    rl_config.useA85 = 0
+    try:
+        yield
+    finally:
+        rl_config.useA85 = previous
+
+
 # ── Color Palette ─────────────────────────────────────────────────────────────
 NAVY          = HexColor("#0D1B2A")
 DEEP_PURPLE   = HexColor("#1B0D2A")
@@ -72,6 +95,16 @@ CATEGORY_ICONS = {
     "Other AI & Tech News":          "Tech News",
 }
 
+CATEGORY_EMOJI = {
+    "Research Breakthroughs":        "🔬",
+    "Product Launches & Updates":    "🚀",
+    "Industry News & Business":      "💼",
+    "Policy, Safety & Ethics":       "⚖️",
+    "Open Source & Developer Tools": "🛠️",
+    "Robotics & Autonomous Systems": "🤖",
+    "Other AI & Tech News":          "📰",
+}
+
 CATEGORY_GRADIENTS = {
     "Research Breakthroughs":        (HexColor("#7C3AED"), HexColor("#A78BFA")),
     "Product Launches & Updates":    (HexColor("#0369A1"), HexColor("#38BDF8")),
@@ -122,21 +155,14 @@ class GradientRect(Flowable):
         self.radius = radius
 
     def draw(self):
-        steps = 60
-        for i in range(steps):
-            t = i / (steps - 1)
-            r = self.color1.red   + t * (self.color2.red   - self.color1.red)
-            g = self.color1.green + t * (self.color2.green - self.color1.green)
-            b = self.color1.blue  + t * (self.color2.blue  - self.color1.blue)
-            self.canv.setFillColorRGB(r, g, b)
-            x = self.width * i / steps
-            w = self.width / steps + 1  # +1 to avoid gaps
-            if i == 0:
-                self.canv.roundRect(x, 0, w + self.radius, self.height, self.radius, fill=1, stroke=0)
-            elif i == steps - 1:
-                self.canv.rect(x, 0, w, self.height, fill=1, stroke=0)
-            else:
-                self.canv.rect(x, 0, w, self.height, fill=1, stroke=0)
+        # One native axial shading clipped to the rounded rectangle
+        canv = self.canv
+        canv.saveState()
+        path = canv.beginPath()
+        path.roundRect(0, 0, self.width, self.height, self.radius)
+        canv.clipPath(path, stroke=0, fill=0)
+        canv.linearGradient(0, 0, self.width, 0, [self.color1, self.color2], extend=False)
+        canv.restoreState()
 
 
 class ColoredRoundRect(Flowable):
@@ -176,9 +202,9 @@ class ShadowRect(Flowable):
 
 # ── Styles ────────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def _make_styles():
-    base = getSampleStyleSheet()
-
+    """Paragraph styles for the whole document, built once per process."""
     def S(name, **kw):
         return ParagraphStyle(name, **kw)
 
@@ -202,7 +228,7 @@ def _make_styles():
         # TOC
         "toc_title": S("toc_title",
             fontSize=22, fontName="Helvetica-Bold", textColor=TEXT_BLACK,
-            leading=28, spaceBefore=0, spaceAfter=12),
+            leading=28, spaceBefore=0, spaceAfter=0),
         "toc_item": S("toc_item",
             fontSize=12, fontName="Helvetica", textColor=DARK_GRAY,
             leading=20, leftIndent=8),
@@ -223,6 +249,18 @@ def _make_styles():
         "exec_body": S("exec_body",
             fontSize=11.5, fontName="Helvetica", textColor=DARK_GRAY,
             leading=19, alignment=TA_JUSTIFY),
+        # Executive summary drawn as a highlighted box by the paragraph
+        # itself. The body frame is CONTENT_W - 12 = 492 pt wide (6 pt frame
+        # padding); the border runs from leftIndent - 16 to 492 - rightIndent
+        # + 16, i.e. a 480 pt box inset 6 pt with 448 pt of text -- the same
+        # geometry as the old CONTENT_W - 24 Table. ReportLab only rounds the
+        # corners when a border is set, hence the same-colour border.
+        "exec_box": S("exec_box",
+            fontSize=11.5, fontName="Helvetica", textColor=DARK_GRAY,
+            leading=19, alignment=TA_JUSTIFY,
+            leftIndent=22, rightIndent=22, spaceBefore=14, spaceAfter=14,
+            backColor=LIGHT_BLUE, borderColor=LIGHT_BLUE, borderWidth=0.5,
+            borderPadding=(14, 16, 14, 16), borderRadius=6),
         "bullet": S("bullet",
             fontSize=11, fontName="Helvetica", textColor=DARK_GRAY,
             leading=18, leftIndent=16, bulletIndent=4),
@@ -271,34 +309,152 @@ def _make_styles():
         "sources_url": S("sources_url",
             fontSize=10, fontName="Helvetica", textColor=BRAND_BLUE,
             leading=15),
+        "methodology": S("meth",
+            fontSize=10.5, fontName="Helvetica", textColor=DARK_GRAY,
+            leading=17, alignment=TA_JUSTIFY),
+        "meta": S("meta",
+            fontSize=9, fontName="Helvetica", textColor=MID_GRAY,
+            leading=13, alignment=TA_CENTER),
+        # Week at a Glance
+        "glance_title": S("ga_title",
+            fontSize=12, fontName="Helvetica-Bold", textColor=INDIGO,
+            leading=16),
+        "glance_item": S("ga_item",
+            fontSize=10.5, fontName="Helvetica", textColor=DARK_GRAY,
+            leading=17),
+        # Category header bar
+        "cat_header": S("ch",
+            fontSize=19, fontName="Helvetica-Bold", textColor=WHITE,
+            leading=24),
+        "cat_count": S("cc",
+            fontSize=11, fontName="Helvetica", textColor=HexColor("#E2E8F0"),
+            leading=15, alignment=TA_RIGHT),
     }
 
 
+# Rank number styles, one per TOP_STORY_COLORS entry
+_TOP_NUM_STYLES = [
+    ParagraphStyle("tn", fontSize=26, fontName="Helvetica-Bold",
+                   textColor=txt_color, leading=32, alignment=TA_CENTER)
+    for txt_color, _ in TOP_STORY_COLORS
+]
+
+
+def _css_hex(color: Color) -> str:
+    """CSS-style #RRGGBB for a color; hexval() gives 0xrrggbb, which only ReportLab reads."""
+    return "#" + color.hexval()[2:].upper()
+
+
+def _source_badge(name, font_size, leading, padding, txt_color, bg_color):
+    """(markup template, style) for a source badge; fill with .format(label=...)."""
+    markup = f'<font color="{_css_hex(txt_color)}" size="{font_size}"><b>{{label}}</b></font>'
+    style = ParagraphStyle(name, fontSize=font_size, fontName="Helvetica-Bold",
+                           textColor=txt_color, leading=leading,
+                           backColor=bg_color, borderPadding=padding)
+    return markup, style
+
+
+# Source badges keyed by source name: 8 pt for story cards, 9 pt for the
+# sources page. Unknown sources use the gray default.
+_SRC_BADGE_8 = {
+    src: _source_badge("sb2", 8, 11, (3, 6, 3, 6), txt_c, bg_c)
+    for src, (txt_c, bg_c) in SOURCE_COLORS.items()
+}
+_SRC_BADGE_8_DEFAULT = _source_badge("sb2", 8, 11, (3, 6, 3, 6), DARK_GRAY, LIGHT_GRAY)
+_SRC_BADGE_9 = {
+    src: _source_badge("sb3", 9, 12, (4, 8, 4, 8), txt_c, bg_c)
+    for src, (txt_c, bg_c) in SOURCE_COLORS.items()
+}
+_SRC_BADGE_9_DEFAULT = _source_badge("sb3", 9, 12, (4, 8, 4, 8), DARK_GRAY, LIGHT_GRAY)
+
+# Paragraph markup templates, filled with str.format
+_TOC_NUM_MARKUP   = '<font color="#94A3B8">{}</font>'
+_TOC_PAGE_MARKUP  = '<font color="#9CA3AF">{}</font>'
+_TOP_LINK_MARKUP  = '<link href="{url}"><font color="#1A56DB">Read full article →</font></link>'
+_CARD_LINK_MARKUP = '<link href="{url}"><font color="#1A56DB">Read more →</font></link>'
+_URL_LINK_MARKUP  = '<link href="{url}">{url}</link>'
+
+
+def _story_link(template: str, url: str) -> str:
+    """
+    Fill a link template with a story URL, escaped for use in an attribute.
+    Empty when there is no usable URL (the summarizer's "#" placeholder),
+    which ReportLab would otherwise reject as an unresolved destination.
+    """
+    if not url.startswith(("http://", "https://")):
+        return ""
+    return template.format(url=escape(url, {'"': "&quot;"}))
+
+
+# Row styles for the TOC and sources list. Each row draws its own hairline
+# separator, so no HRFlowable is needed between rows. Flowables can't be
+# shared between positions in a story (Platypus marks them while laying
+# out), but TableStyles can.
+_TOC_ROW_STYLE = TableStyle([
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("LEFTPADDING",   (0, 0), (-1, -1), 4),
+    ("RIGHTPADDING",  (0, 0), (-1, -1), 4),
+    ("TOPPADDING",    (0, 0), (-1, -1), 5),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+    ("ALIGN", (2, 0), (2, -1), "RIGHT"),
+    ("LINEBELOW", (0, -1), (-1, -1), 0.5, LIGHT_GRAY),
+])
+_SOURCE_ROW_STYLE = TableStyle([
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("LEFTPADDING",   (0, 0), (-1, -1), 6),
+    ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
+    ("TOPPADDING",    (0, 0), (-1, -1), 7),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 7),
+    ("LINEBELOW", (0, -1), (-1, -1), 0.5, LIGHT_GRAY),
+])
+_CARD_STYLE = TableStyle([
+    ("BACKGROUND",    (0, 0), (-1, -1), CARD_BG),
+    ("BOX",           (0, 0), (-1, -1), 0.5, CARD_BORDER),
+    ("LEFTPADDING",   (0, 0), (-1, -1), 10),
+    ("RIGHTPADDING",  (0, 0), (-1, -1), 10),
+    ("TOPPADDING",    (0, 0), (-1, -1), 10),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 10),
+    ("ROUNDEDCORNERS", [6]),
+])
+_CARD_COL_WIDTHS = ((CONTENT_W - 10) / 2 - 10,)
+_METHODOLOGY_STYLE = TableStyle([
+    ("BACKGROUND",    (0, 0), (-1, -1), OFF_WHITE),
+    ("LEFTPADDING",   (0, 0), (-1, -1), 16),
+    ("RIGHTPADDING",  (0, 0), (-1, -1), 16),
+    ("TOPPADDING",    (0, 0), (-1, -1), 14),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 14),
+    ("BOX",           (0, 0), (-1, -1), 0.5, CARD_BORDER),
+    ("ROUNDEDCORNERS", [6]),
+])
+
+
 # ── Page Templates ────────────────────────────────────────────────────────────
 
+def _make_dot_grid() -> PDFPathObject:
+    """Cover dot-grid decoration as a single path, filled in one operation."""
+    path = PDFPathObject()
+    for x in range(int(MARGIN), int(PAGE_W - MARGIN), 24):
+        for y in range(int(MARGIN), int(PAGE_H - MARGIN), 24):
+            path.circle(x, y, 1)
+    return path
+
+
+_DOT_GRID = _make_dot_grid()
+
+
 def _cover_background(canvas, doc):
     """Full-page gradient cover background."""
     canvas.saveState()
-    steps = 80
-    for i in range(steps):
-        t = i / (steps - 1)
-        r = NAVY.red   + t * (DEEP_PURPLE.red   - NAVY.red)
-        g = NAVY.green + t * (DEEP_PURPLE.green - NAVY.green)
-        b = NAVY.blue  + t * (DEEP_PURPLE.blue  - NAVY.blue)
-        canvas.setFillColorRGB(r, g, b)
-        y = PAGE_H * i / steps
-        canvas.rect(0, y, PAGE_W, PAGE_H / steps + 1, fill=1, stroke=0)
+    canvas.linearGradient(0, 0, 0, PAGE_H, [NAVY, DEEP_PURPLE])
 
     # Subtle dot grid decoration
     canvas.setFillColorRGB(1, 1, 1, 0.04)
-    for x in range(int(MARGIN), int(PAGE_W - MARGIN), 24):
-        for y in range(int(MARGIN), int(PAGE_H - MARGIN), 24):
-            canvas.circle(x, y, 1, fill=1, stroke=0)
+    canvas.drawPath(_DOT_GRID, fill=1, stroke=0)
     canvas.restoreState()
 
 
-def _page_background(canvas, doc):
-    """Normal page: white with footer."""
+def _page_background(canvas, doc, footer_text: str):
+    """Normal page: white with footer. footer_text is bound per document."""
     canvas.saveState()
     canvas.setFillColor(WHITE)
     canvas.rect(0, 0, PAGE_W, PAGE_H, fill=1, stroke=0)
@@ -310,16 +466,69 @@ def _page_background(canvas, doc):
     canvas.line(MARGIN, footer_y + 10, PAGE_W - MARGIN, footer_y + 10)
 
     # Footer text
-    date_str = datetime.now(timezone.utc).strftime("%B %d, %Y")
     canvas.setFont("Helvetica", 8)
     canvas.setFillColor(MID_GRAY)
-    canvas.drawString(MARGIN, footer_y, f"AI & Tech Weekly Briefing  •  {date_str}")
+    canvas.drawString(MARGIN, footer_y, footer_text)
     canvas.drawRightString(PAGE_W - MARGIN, footer_y, "Curated by Claude AI")
     canvas.drawCentredString(PAGE_W / 2, footer_y, f"— {doc.page} —")
 
     canvas.restoreState()
 
 
+def _cover_stats_drawing(stats: list, styles: dict) -> Drawing:
+    """
+    Cover stats box as fixed vector graphics: a translucent rounded panel
+    with one column per (number, label) pair and hairline dividers. Drawn
+    directly, with none of the wrap/split work a Table of Paragraphs needs.
+    """
+    num_style = styles["cover_stat_num"]
+    label_style = styles["cover_stat_label"]
+    box_w, box_h = CONTENT_W - 40, 74
+    col_w = box_w / len(stats)
+    rule = Color(1, 1, 1, alpha=0x30 / 255)
+
+    drawing = Drawing(CONTENT_W, box_h + 6)
+    drawing.hAlign = "CENTER"
+    x0, y0 = 20, 3
+    drawing.add(Rect(x0, y0, box_w, box_h, rx=8, ry=8,
+                     fillColor=Color(1, 1, 1, alpha=0x18 / 255), strokeColor=None))
+    drawing.add(Line(x0, y0 + box_h, x0 + box_w, y0 + box_h, strokeColor=rule, strokeWidth=0.5))
+    drawing.add(Line(x0, y0, x0 + box_w, y0, strokeColor=rule, strokeWidth=0.5))
+    for i, (number, label) in enumerate(stats):
+        if i:
+            x = x0 + i * col_w
+            drawing.add(Line(x, y0, x, y0 + box_h, strokeColor=rule, strokeWidth=0.5))
+        center = x0 + (i + 0.5) * col_w
+        drawing.add(String(center, y0 + 36, str(number), textAnchor="middle",
+                           fontName=num_style.fontName, fontSize=num_style.fontSize,
+                           fillColor=num_style.textColor))
+        drawing.add(String(center, y0 + 12, label, textAnchor="middle",
+                           fontName=label_style.fontName, fontSize=label_style.fontSize,
+                           fillColor=label_style.textColor))
+    return drawing
+
+
+def _build_empty_pdf(target, date_range: str) -> None:
+    """Single cover-style page for weeks with no stories, drawn without Platypus."""
+    c = Canvas(target, pagesize=letter, pageCompression=1)
+    c.setTitle(f"AI & Tech Weekly Briefing — {date_range}")
+    c.setAuthor("Claude AI")
+    c.setSubject("Weekly AI & Technology News Briefing")
+    _cover_background(c, None)
+
+    c.setFillColor(WHITE)
+    c.setFont("Helvetica-Bold", 36)
+    c.drawCentredString(PAGE_W / 2, PAGE_H / 2 + 40, "AI & Tech Weekly Briefing")
+    c.setFillColor(HexColor("#CBD5E1"))
+    c.setFont("Helvetica", 15)
+    c.drawCentredString(PAGE_W / 2, PAGE_H / 2, date_range)
+    c.setFillColor(HexColor("#94A3B8"))
+    c.setFont("Helvetica", 11)
+    c.drawCentredString(PAGE_W / 2, PAGE_H / 2 - 40, "No stories were found for this period.")
+    c.showPage()
+    c.save()
+
+
 # ── Main PDF Generation Function ──────────────────────────────────────────────
 
 def generate_pdf(
@@ -334,8 +543,6 @@ def generate_pdf(
         output_path: Override for the output file path. If None, uses project root.
     """
     now = datetime.now(timezone.utc)
-    week_ago = now - timedelta(days=7)
-    date_range = f"{week_ago.strftime('%B %d')} – {now.strftime('%B %d, %Y')}"
     date_slug = now.strftime("%Y-%m-%d")
 
     if output_path:
@@ -346,20 +553,53 @@ def generate_pdf(
 
     pdf_path.parent.mkdir(parents=True, exist_ok=True)
 
+    logger.info("Building PDF: %s", pdf_path)
+    _build_pdf(briefing, str(pdf_path), now)
+    size_kb = pdf_path.stat().st_size // 1024
+    logger.info("PDF generated: %s (%d KB)", pdf_path, size_kb)
+    return pdf_path
+
+
+def generate_pdf_bytes(briefing: dict) -> bytes:
+    """
+    Generate the PDF briefing in memory and return its bytes.
+
+    Use this when the caller only needs the document (e.g. to attach or
+    upload it) and writing it to disk first would be wasted I/O.
+    """
+    buffer = io.BytesIO()
+    _build_pdf(briefing, buffer, datetime.now(timezone.utc))
+    return buffer.getvalue()
+
+
+@_raw_binary_streams()
+def _build_pdf(briefing: dict, target, now: datetime) -> None:
+    """Lay out the briefing and write the PDF to target (a path or binary file object)."""
+    week_ago = now - timedelta(days=7)
+    date_range = f"{week_ago.strftime('%B %d')} – {now.strftime('%B %d, %Y')}"
+
     styles = _make_styles()
     story_elements = []
 
     # Collect stats
-    categories = briefing.get("categories", {})
-    all_stories = [s for cat in categories.values() for s in cat]
-    sources = {s.get("source", "Unknown") for s in all_stories}
     top_stories = briefing.get("top_stories", [])
-    non_empty_cats = [(k, v) for k, v in categories.items() if v]
-    total_stories = len(all_stories)
+    total_stories = 0
+    sources = set()
+    non_empty_cats = []
+    for cat_name, cat_stories in briefing.get("categories", {}).items():
+        if cat_stories:
+            non_empty_cats.append((cat_name, cat_stories))
+        total_stories += len(cat_stories)
+        sources.update(s.get("source", "Unknown") for s in cat_stories)
+
+    if not total_stories and not top_stories:
+        logger.warning("Briefing has no stories; writing a placeholder PDF")
+        _build_empty_pdf(target, date_range)
+        return
 
     # ── Document setup ────────────────────────────────────────────────────────
     doc = BaseDocTemplate(
-        str(pdf_path),
+        target,
         pagesize=letter,
         leftMargin=MARGIN,
         rightMargin=MARGIN,
@@ -368,6 +608,7 @@ def generate_pdf(
         title=f"AI & Tech Weekly Briefing — {date_range}",
         author="Claude AI",
         subject="Weekly AI & Technology News Briefing",
+        pageCompression=1,
     )
 
     cover_frame = Frame(0, 0, PAGE_W, PAGE_H, leftPadding=0, rightPadding=0,
@@ -377,140 +618,84 @@ def generate_pdf(
 
     cover_template = PageTemplate(id="Cover", frames=[cover_frame],
                                   onPage=_cover_background)
+    footer_text = f"AI & Tech Weekly Briefing  •  {now.strftime('%B %d, %Y')}"
     body_template  = PageTemplate(id="Body",  frames=[body_frame],
-                                  onPage=_page_background)
+                                  onPage=functools.partial(_page_background,
+                                                           footer_text=footer_text))
     doc.addPageTemplates([cover_template, body_template])
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PAGE 1 — COVER
     # ═══════════════════════════════════════════════════════════════════════════
-    story_elements.append(NextPageTemplate("Cover"))
-    story_elements.append(Spacer(1, 1.6 * inch))
-
-    story_elements.append(Paragraph("AI & Tech", styles["cover_title"]))
-    story_elements.append(Paragraph("Weekly Briefing", styles["cover_title"]))
-    story_elements.append(Spacer(1, 0.18 * inch))
-    story_elements.append(Paragraph(date_range, styles["cover_subtitle"]))
-    story_elements.append(Spacer(1, 0.6 * inch))
-
-    # Stats box — 3-column table
-    stat_data = [[
-        Paragraph(str(total_stories), styles["cover_stat_num"]),
-        Paragraph(str(len(sources)),  styles["cover_stat_num"]),
-        Paragraph(str(len(non_empty_cats)), styles["cover_stat_num"]),
-    ], [
-        Paragraph("Total Stories",  styles["cover_stat_label"]),
-        Paragraph("Sources",        styles["cover_stat_label"]),
-        Paragraph("Categories",     styles["cover_stat_label"]),
-    ]]
-    stat_col_w = (CONTENT_W - 40) / 3
-    stat_table = Table(
-        stat_data,
-        colWidths=[stat_col_w] * 3,
-        rowHeights=[52, 22],
-        hAlign="CENTER",
-    )
-    stat_table.setStyle(TableStyle([
-        ("BACKGROUND",  (0, 0), (-1, -1), HexColor("#FFFFFF18")),
-        ("LINEABOVE",   (0, 0), (-1, 0),  0.5, HexColor("#FFFFFF30")),
-        ("LINEBELOW",   (0, -1), (-1, -1), 0.5, HexColor("#FFFFFF30")),
-        ("LINEBEFORE",  (1, 0), (1, -1), 0.5, HexColor("#FFFFFF30")),
-        ("LINEBEFORE",  (2, 0), (2, -1), 0.5, HexColor("#FFFFFF30")),
-        ("TOPPADDING",  (0, 0), (-1, -1), 10),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-        ("LEFTPADDING",  (0, 0), (-1, -1), 12),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 12),
-        ("ROUNDEDCORNERS", [8]),
-    ]))
-
-    # Center the stat table on the page
-    stat_wrapper = Table([[stat_table]], colWidths=[CONTENT_W])
-    stat_wrapper.setStyle(TableStyle([("ALIGN", (0, 0), (-1, -1), "CENTER")]))
-    story_elements.append(stat_wrapper)
-
-    story_elements.append(Spacer(1, 2.0 * inch))
-    story_elements.append(Paragraph(
-        "Curated by Claude AI  •  Automated with GitHub Actions",
-        styles["cover_footer"]
-    ))
+    story_elements.extend([
+        NextPageTemplate("Cover"),
+        Spacer(1, 1.6 * inch),
+        Paragraph("AI & Tech", styles["cover_title"]),
+        Paragraph("Weekly Briefing", styles["cover_title"]),
+        Spacer(1, 0.18 * inch),
+        Paragraph(date_range, styles["cover_subtitle"]),
+        Spacer(1, 0.6 * inch),
+        # Stats box — 3 columns of number over label
+        _cover_stats_drawing(
+            [(total_stories, "Total Stories"),
+             (len(sources), "Sources"),
+             (len(non_empty_cats), "Categories")],
+            styles,
+        ),
+        Spacer(1, 2.0 * inch),
+        Paragraph(
+            "Curated by Claude AI  •  Automated with GitHub Actions",
+            styles["cover_footer"]
+        ),
+    ])
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PAGE 2 — TABLE OF CONTENTS
     # ═══════════════════════════════════════════════════════════════════════════
-    story_elements.append(NextPageTemplate("Body"))
-    story_elements.append(PageBreak())
-    story_elements.append(Spacer(1, 0.1 * inch))
-
-    # TOC header accent bar
-    story_elements.append(Table(
-        [[Paragraph("Table of Contents", styles["toc_title"])]],
-        colWidths=[CONTENT_W],
-        style=[
-            ("LEFTPADDING",  (0, 0), (-1, -1), 0),
-            ("BOTTOMPADDING",(0, 0), (-1, -1), 0),
-        ],
-    ))
-    story_elements.append(HRFlowable(width=CONTENT_W, thickness=2,
-                                     color=BRAND_BLUE, spaceAfter=12))
-
-    toc_items = [
-        ("01", "Executive Summary",  "p. 3"),
-        ("02", "Top 5 Stories",       "p. 3"),
-    ]
+    story_elements.extend([
+        NextPageTemplate("Body"),
+        PageBreak(),
+        Spacer(1, 0.1 * inch),
+        # TOC header accent bar
+        Paragraph("Table of Contents", styles["toc_title"]),
+        HRFlowable(width=CONTENT_W, thickness=2, color=BRAND_BLUE, spaceAfter=12),
+    ])
+
+    toc_items = [("01", "Executive Summary", "p. 3")]
+    if top_stories:
+        toc_items.append(("02", "Top 5 Stories", "p. 3"))
     page_num = 4
     for cat_name, _ in non_empty_cats:
         toc_items.append((f"{page_num:02d}", cat_name, f"p. {page_num}"))
         page_num += 1
     toc_items.append((f"{page_num:02d}", "Sources & Methodology", f"p. {page_num}"))
 
-    for num, title, pg in toc_items:
-        row = Table(
+    story_elements.extend(
+        Table(
             [[
-                Paragraph(f'<font color="#94A3B8">{num}</font>', styles["toc_item"]),
-                Paragraph(title, styles["toc_item_bold"]),
-                Paragraph(f'<font color="#9CA3AF">{pg}</font>', styles["toc_item"]),
+                Paragraph(_TOC_NUM_MARKUP.format(num), styles["toc_item"]),
+                Paragraph(escape(title), styles["toc_item_bold"]),
+                Paragraph(_TOC_PAGE_MARKUP.format(pg), styles["toc_item"]),
             ]],
             colWidths=[30, CONTENT_W - 90, 60],
-            style=[
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("LEFTPADDING",   (0, 0), (-1, -1), 4),
-                ("RIGHTPADDING",  (0, 0), (-1, -1), 4),
-                ("TOPPADDING",    (0, 0), (-1, -1), 5),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-                ("ALIGN", (2, 0), (2, -1), "RIGHT"),
-            ],
+            style=_TOC_ROW_STYLE,
         )
-        story_elements.append(row)
-        story_elements.append(HRFlowable(
-            width=CONTENT_W, thickness=0.5, color=LIGHT_GRAY, spaceAfter=0))
+        for num, title, pg in toc_items
+    )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PAGE 3 — EXECUTIVE SUMMARY + TOP STORIES
     # ═══════════════════════════════════════════════════════════════════════════
-    story_elements.append(PageBreak())
-    story_elements.append(Spacer(1, 0.1 * inch))
-
-    # --- Executive Summary ---
-    story_elements.append(Paragraph("📊  Executive Summary", styles["exec_title"]))
-    story_elements.append(HRFlowable(width=CONTENT_W, thickness=2,
-                                     color=BRAND_BLUE, spaceAfter=10))
-
-    # Highlighted summary box
+    # --- Executive Summary, in a highlighted box ---
     exec_text = briefing.get("executive_summary", "No summary available.")
-    exec_box = Table(
-        [[Paragraph(exec_text, styles["exec_body"])]],
-        colWidths=[CONTENT_W - 24],
-        style=[
-            ("BACKGROUND",    (0, 0), (-1, -1), LIGHT_BLUE),
-            ("LEFTPADDING",   (0, 0), (-1, -1), 16),
-            ("RIGHTPADDING",  (0, 0), (-1, -1), 16),
-            ("TOPPADDING",    (0, 0), (-1, -1), 14),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 14),
-            ("ROUNDEDCORNERS", [6]),
-        ],
-    )
-    story_elements.append(exec_box)
-    story_elements.append(Spacer(1, 0.25 * inch))
+    story_elements.extend([
+        PageBreak(),
+        Spacer(1, 0.1 * inch),
+        Paragraph("📊  Executive Summary", styles["exec_title"]),
+        HRFlowable(width=CONTENT_W, thickness=2, color=BRAND_BLUE, spaceAfter=10),
+        Paragraph(escape(exec_text), styles["exec_box"]),
+        Spacer(1, 0.25 * inch),
+    ])
 
     # Week at a Glance callout
     glance_items = [
@@ -520,12 +705,8 @@ def generate_pdf(
         f"⭐  {len(top_stories)} top stories selected by Claude AI",
     ]
     glance_content = [
-        [Paragraph("<b>Week at a Glance</b>", ParagraphStyle(
-            "ga_title", fontSize=12, fontName="Helvetica-Bold",
-            textColor=INDIGO, leading=16))],
-    ] + [[Paragraph(f"  {item}", ParagraphStyle(
-        "ga_item", fontSize=10.5, fontName="Helvetica",
-        textColor=DARK_GRAY, leading=17))] for item in glance_items]
+        [Paragraph("<b>Week at a Glance</b>", styles["glance_title"])],
+    ] + [[Paragraph(f"  {item}", styles["glance_item"])] for item in glance_items]
 
     glance_box = Table(
         glance_content,
@@ -539,25 +720,23 @@ def generate_pdf(
             ("LINEAFTER",     (0, 0), (0, -1), 3, INDIGO),
         ],
     )
-    story_elements.append(glance_box)
-    story_elements.append(Spacer(1, 0.35 * inch))
+    story_elements.extend([glance_box, Spacer(1, 0.35 * inch)])
 
     # --- Top 5 Stories ---
-    story_elements.append(Paragraph("⭐  Top 5 Stories of the Week", styles["exec_title"]))
-    story_elements.append(HRFlowable(width=CONTENT_W, thickness=2,
-                                     color=ACCENT_GOLD, spaceAfter=12))
+    if top_stories:
+        story_elements.extend([
+            Paragraph("⭐  Top 5 Stories of the Week", styles["exec_title"]),
+            HRFlowable(width=CONTENT_W, thickness=2, color=ACCENT_GOLD, spaceAfter=12),
+        ])
 
     for i, story in enumerate(top_stories[:5]):
-        txt_color, badge_bg = TOP_STORY_COLORS[i % len(TOP_STORY_COLORS)]
+        _, badge_bg = TOP_STORY_COLORS[i % len(TOP_STORY_COLORS)]
         badge_num = str(i + 1)
         src = story.get("source", "Unknown")
-        src_text_c, src_bg_c = SOURCE_COLORS.get(src, (DARK_GRAY, LIGHT_GRAY))
         url = story.get("url", "#")
 
         badge_cell = Table(
-            [[Paragraph(badge_num, ParagraphStyle(
-                "tn", fontSize=26, fontName="Helvetica-Bold",
-                textColor=txt_color, leading=32, alignment=TA_CENTER))]],
+            [[Paragraph(badge_num, _TOP_NUM_STYLES[i % len(_TOP_NUM_STYLES)])]],
             colWidths=[44],
             rowHeights=[44],
             style=[
@@ -567,23 +746,18 @@ def generate_pdf(
             ],
         )
 
-        src_display = src[:20]
-        src_badge_p = Paragraph(
-            f'<font color="{src_text_c.hexval()}" size="8"><b>{src_display}</b></font>',
-            ParagraphStyle("sb2", fontSize=8, fontName="Helvetica-Bold",
-                           textColor=src_text_c, leading=11,
-                           backColor=src_bg_c, borderPadding=(3, 6, 3, 6))
-        )
+        badge_markup, badge_style = _SRC_BADGE_8.get(src, _SRC_BADGE_8_DEFAULT)
+        src_badge_p = Paragraph(badge_markup.format(label=escape(src[:20])), badge_style)
 
         title_text  = story.get("title", "Untitled")
         reason_text = story.get("reason", "")
-        link_text   = f'<link href="{url}"><font color="#1A56DB">Read full article →</font></link>'
+        link_text   = _story_link(_TOP_LINK_MARKUP, url)
 
         content_cell = [
             src_badge_p,
             Spacer(1, 4),
-            Paragraph(title_text, styles["top_title"]),
-            Paragraph(reason_text, styles["top_body"]),
+            Paragraph(escape(title_text), styles["top_title"]),
+            Paragraph(escape(reason_text), styles["top_body"]),
             Spacer(1, 4),
             Paragraph(link_text, styles["top_link"]),
         ]
@@ -609,31 +783,15 @@ def generate_pdf(
     # CATEGORY PAGES
     # ═══════════════════════════════════════════════════════════════════════════
     for cat_name, cat_stories in non_empty_cats:
-        story_elements.append(PageBreak())
-        story_elements.append(Spacer(1, 0.05 * inch))
-
         grad_c1, grad_c2 = CATEGORY_GRADIENTS.get(
             cat_name, (INDIGO, BRAND_BLUE))
-        cat_emoji = {
-            "Research Breakthroughs":        "🔬",
-            "Product Launches & Updates":    "🚀",
-            "Industry News & Business":      "💼",
-            "Policy, Safety & Ethics":       "⚖️",
-            "Open Source & Developer Tools": "🛠️",
-            "Robotics & Autonomous Systems": "🤖",
-            "Other AI & Tech News":          "📰",
-        }.get(cat_name, "📌")
+        cat_emoji = CATEGORY_EMOJI.get(cat_name, "📌")
 
         # Category header — gradient bar
         header_content = Table(
             [[
-                Paragraph(f"{cat_emoji}  {cat_name}", ParagraphStyle(
-                    "ch", fontSize=19, fontName="Helvetica-Bold",
-                    textColor=WHITE, leading=24)),
-                Paragraph(f"{len(cat_stories)} stories", ParagraphStyle(
-                    "cc", fontSize=11, fontName="Helvetica",
-                    textColor=HexColor("#E2E8F0"), leading=15,
-                    alignment=TA_RIGHT)),
+                Paragraph(f"{cat_emoji}  {escape(cat_name)}", styles["cat_header"]),
+                Paragraph(f"{len(cat_stories)} stories", styles["cat_count"]),
             ]],
             colWidths=[CONTENT_W - 90, 80],
             style=[
@@ -646,48 +804,32 @@ def generate_pdf(
                 ("ROUNDEDCORNERS", [6]),
             ],
         )
-        story_elements.append(header_content)
-        story_elements.append(Spacer(1, 10))
-
-        # Story cards — 2-column grid
-        cards_left  = []
-        cards_right = []
-        for idx, s in enumerate(cat_stories):
-            card = _build_story_card(s, styles)
-            if idx % 2 == 0:
-                cards_left.append(card)
-            else:
-                cards_right.append(card)
-
-        col_w = (CONTENT_W - 10) / 2
-
-        # Pair up left and right cards
-        max_rows = max(len(cards_left), len(cards_right))
-        for row_i in range(max_rows):
-            left_cell  = cards_left[row_i]  if row_i < len(cards_left)  else Spacer(1, 1)
-            right_cell = cards_right[row_i] if row_i < len(cards_right) else Spacer(1, 1)
-            row_table = Table(
-                [[left_cell, right_cell]],
-                colWidths=[col_w, col_w],
-                style=[
-                    ("VALIGN",        (0, 0), (-1, -1), "TOP"),
-                    ("LEFTPADDING",   (0, 0), (-1, -1), 0),
-                    ("RIGHTPADDING",  (0, 0), (-1, -1), 0),
-                    ("TOPPADDING",    (0, 0), (-1, -1), 0),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-                ],
-            )
-            story_elements.append(row_table)
-            story_elements.append(Spacer(1, 8))
+        # Story cards — two balanced columns, flowed top to bottom
+        cards = [
+            flowable
+            for s in cat_stories
+            for flowable in (_build_story_card(s, styles), Spacer(1, 8))
+        ]
+        story_elements.extend([
+            PageBreak(),
+            Spacer(1, 0.05 * inch),
+            header_content,
+            Spacer(1, 10),
+            BalancedColumns(
+                cards, nCols=2, leftPadding=0, rightPadding=0, innerPadding=10,
+                topPadding=0, bottomPadding=0,
+            ),
+        ])
 
     # ═══════════════════════════════════════════════════════════════════════════
     # FINAL PAGE — SOURCES & METHODOLOGY
     # ═══════════════════════════════════════════════════════════════════════════
-    story_elements.append(PageBreak())
-    story_elements.append(Spacer(1, 0.1 * inch))
-    story_elements.append(Paragraph("📚  Sources & Methodology", styles["sources_title"]))
-    story_elements.append(HRFlowable(width=CONTENT_W, thickness=2,
-                                     color=BRAND_BLUE, spaceAfter=12))
+    story_elements.extend([
+        PageBreak(),
+        Spacer(1, 0.1 * inch),
+        Paragraph("📚  Sources & Methodology", styles["sources_title"]),
+        HRFlowable(width=CONTENT_W, thickness=2, color=BRAND_BLUE, spaceAfter=12),
+    ])
 
     source_info = [
         ("Hacker News",           "https://news.ycombinator.com",             "AI/tech stories via Algolia search API, filtered for relevance"),
@@ -700,34 +842,19 @@ def generate_pdf(
     ]
 
     for src_name, src_url, src_desc in source_info:
-        src_txt_c, src_bg_c = SOURCE_COLORS.get(src_name, (DARK_GRAY, LIGHT_GRAY))
-        src_badge_p = Paragraph(
-            f'<font color="{src_txt_c.hexval()}" size="9"><b>{src_name}</b></font>',
-            ParagraphStyle("sb3", fontSize=9, fontName="Helvetica-Bold",
-                           textColor=src_txt_c, leading=12,
-                           backColor=src_bg_c, borderPadding=(4, 8, 4, 8))
-        )
+        badge_markup, badge_style = _SRC_BADGE_9.get(src_name, _SRC_BADGE_9_DEFAULT)
+        src_badge_p = Paragraph(badge_markup.format(label=src_name), badge_style)
         link_p = Paragraph(
-            f'<link href="{src_url}">{src_url}</link>',
+            _URL_LINK_MARKUP.format(url=src_url),
             styles["sources_url"]
         )
         desc_p = Paragraph(src_desc, styles["sources_body"])
         row = Table(
             [[src_badge_p, link_p, desc_p]],
             colWidths=[110, 180, CONTENT_W - 310],
-            style=[
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING",   (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
-                ("TOPPADDING",    (0, 0), (-1, -1), 7),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 7),
-            ],
+            style=_SOURCE_ROW_STYLE,
         )
         story_elements.append(row)
-        story_elements.append(HRFlowable(width=CONTENT_W, thickness=0.5,
-                                         color=LIGHT_GRAY, spaceAfter=0))
-
-    story_elements.append(Spacer(1, 0.3 * inch))
 
     # Methodology box
     methodology = (
@@ -739,63 +866,65 @@ def generate_pdf(
         "no manual intervention."
     )
     meth_box = Table(
-        [[Paragraph(f"<b>Methodology</b><br/><br/>{methodology}", ParagraphStyle(
-            "meth", fontSize=10.5, fontName="Helvetica", textColor=DARK_GRAY,
-            leading=17, alignment=TA_JUSTIFY))]],
+        [[Paragraph(f"<b>Methodology</b><br/><br/>{methodology}", styles["methodology"])]],
         colWidths=[CONTENT_W - 24],
-        style=[
-            ("BACKGROUND",    (0, 0), (-1, -1), OFF_WHITE),
-            ("LEFTPADDING",   (0, 0), (-1, -1), 16),
-            ("RIGHTPADDING",  (0, 0), (-1, -1), 16),
-            ("TOPPADDING",    (0, 0), (-1, -1), 14),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 14),
-            ("BOX",           (0, 0), (-1, -1), 0.5, CARD_BORDER),
-            ("ROUNDEDCORNERS", [6]),
-        ],
+        style=_METHODOLOGY_STYLE,
     )
-    story_elements.append(meth_box)
-    story_elements.append(Spacer(1, 0.2 * inch))
 
     gen_time = now.strftime("%A, %B %d, %Y at %H:%M UTC")
-    story_elements.append(Paragraph(
-        f"Generated: {gen_time}  •  Powered by GitHub Actions  •  Briefing v2.0",
-        ParagraphStyle("meta", fontSize=9, fontName="Helvetica",
-                       textColor=MID_GRAY, leading=13, alignment=TA_CENTER)
-    ))
+    story_elements.extend([
+        Spacer(1, 0.3 * inch),
+        meth_box,
+        Spacer(1, 0.2 * inch),
+        Paragraph(
+            f"Generated: {gen_time}  •  Powered by GitHub Actions  •  Briefing v2.0",
+            styles["meta"]
+        ),
+    ])
 
     # ── Build the PDF ─────────────────────────────────────────────────────────
-    logger.info("Building PDF: %s", pdf_path)
     doc.build(story_elements)
-    size_kb = pdf_path.stat().st_size // 1024
-    logger.info("PDF generated: %s (%d KB)", pdf_path, size_kb)
-    return pdf_path
 
 
 # ── Story Card Builder ────────────────────────────────────────────────────────
 
-def _build_story_card(story: dict, styles: dict) -> Table:
-    """Build a single story card flowable for a category section."""
-    src = story.get("source", "Unknown")
-    src_txt_c, src_bg_c = SOURCE_COLORS.get(src, (DARK_GRAY, LIGHT_GRAY))
-    title = story.get("title", "Untitled")
-    summary = story.get("summary", "")
-    url = story.get("url", "#")
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, adding an ellipsis only when it was cut."""
+    return text if len(text) <= limit else text[:limit] + "…"
+
 
+@functools.lru_cache(maxsize=2048)
+def _story_card_markup(src: str, title: str, summary: str, url: str) -> tuple:
+    """
+    Truncated, formatted paragraph markup for a story card. Cached because
+    regenerating a briefing repeats the same stories; the flowables
+    themselves hold layout state and are built fresh each time.
+    """
     # Truncate very long source names
     src_display = src[:22] if len(src) > 22 else src
+    badge_markup, badge_style = _SRC_BADGE_8.get(src, _SRC_BADGE_8_DEFAULT)
 
-    # Source badge — rendered as a colored Paragraph (avoids nested Table width issues)
-    src_badge_p = Paragraph(
-        f'<font color="{src_txt_c.hexval()}" size="8"><b>{src_display}</b></font>',
-        ParagraphStyle("cb2", fontSize=8, fontName="Helvetica-Bold",
-                       textColor=src_txt_c, leading=11,
-                       backColor=src_bg_c, borderPadding=(3, 6, 3, 6))
+    # Title (truncate to keep cards balanced). Escaped after truncating so
+    # an entity is never cut in half.
+    title_display = escape(_truncate(title, 120))
+    summary_display = escape(_truncate(summary, 280))
+    link_text = _story_link(_CARD_LINK_MARKUP, url)
+
+    return (badge_markup.format(label=escape(src_display)), badge_style,
+            title_display, summary_display, link_text)
+
+
+def _build_story_card(story: dict, styles: dict) -> Table:
+    """Build a single story card flowable for a category section."""
+    badge_text, badge_style, title_display, summary_display, link_text = _story_card_markup(
+        story.get("source", "Unknown"),
+        story.get("title", "Untitled"),
+        story.get("summary", ""),
+        story.get("url", "#"),
     )
 
-    # Title (truncate to keep cards balanced)
-    title_display = title[:120] + ("…" if len(title) > 120 else "")
-    summary_display = summary[:280] + ("…" if len(summary) > 280 else "")
-    link_text = f'<link href="{url}"><font color="#1A56DB">Read more →</font></link>'
+    # Source badge — rendered as a colored Paragraph (avoids nested Table width issues)
+    src_badge_p = Paragraph(badge_text, badge_style)
 
     card_inner = [
         src_badge_p,
@@ -807,17 +936,21 @@ def _build_story_card(story: dict, styles: dict) -> Table:
         Paragraph(link_text, styles["card_link"]),
     ]
 
+    # Measure the content once and fix the row height, so the Table doesn't
+    # re-wrap every paragraph each time BalancedColumns measures the card
+    # while searching for a column split. Mirrors Table._listCellGeom.
+    inner_w = _CARD_COL_WIDTHS[0] - 20          # LEFT/RIGHTPADDING of _CARD_STYLE
+    height = 20                                 # TOP/BOTTOMPADDING of _CARD_STYLE
+    for flowable in card_inner:
+        height += (flowable.wrap(inner_w, PAGE_H)[1]
+                   + flowable.getSpaceBefore() + flowable.getSpaceAfter())
+    height -= card_inner[0].getSpaceBefore() + card_inner[-1].getSpaceAfter()
+
     card = Table(
         [[card_inner]],
-        colWidths=[(CONTENT_W - 10) / 2 - 10],
-        style=[
-            ("BACKGROUND",    (0, 0), (-1, -1), CARD_BG),
-            ("BOX",           (0, 0), (-1, -1), 0.5, CARD_BORDER),
-            ("LEFTPADDING",   (0, 0), (-1, -1), 10),
-            ("RIGHTPADDING",  (0, 0), (-1, -1), 10),
-            ("TOPPADDING",    (0, 0), (-1, -1), 10),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 10),
-            ("ROUNDEDCORNERS", [6]),
-        ],
+        colWidths=_CARD_COL_WIDTHS,
+        rowHeights=(height,),
+        hAlign="LEFT",
+        style=_CARD_STYLE,
     )
     return card
@@ -2,15 +2,31 @@
 Summarizer module - uses Claude API to analyze, categorize, and summarize
 the aggregated news items.
 """
+import functools
 import json
 import logging
 import os
-from typing import Optional
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 
-import anthropic
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to stdlib json
+    orjson = None
+
+from .aggregator import NewsItem
+
+if TYPE_CHECKING:
+    import anthropic
 
 logger = logging.getLogger(__name__)
 
+# Default model: categorising and summarising ~60 short items doesn't need a
+# frontier model. Override with ANTHROPIC_MODEL or main.py --model.
+DEFAULT_MODEL = "claude-haiku-4-5"
+
 # Categories used for classification
 CATEGORIES = [
     "Research Breakthroughs",
@@ -32,51 +48,42 @@ CATEGORY_DESCRIPTIONS = {
     "Other AI & Tech News": "General tech news, miscellaneous",
 }
 
+# Larger inputs are split into parallel requests of at most this many items,
+# keeping each response well inside max_tokens
+_MAX_ITEMS_PER_CALL = 50
 
-def _build_news_text(items: list[dict], max_items: int = 50) -> str:
-    """Format news items into a compact text block for the prompt."""
-    lines = []
-    for i, item in enumerate(items[:max_items], 1):
-        lines.append(
-            f"[{i}] SOURCE: {item['source']}\n"
-            f"    TITLE: {item['title']}\n"
-            f"    URL: {item['url']}\n"
-            f"    SUMMARY: {item['summary'][:300]}\n"
-        )
-    return "\n".join(lines)
+# Fields every story in a validated result is guaranteed to have
+_TOP_STORY_DEFAULTS = {"title": "Untitled", "url": "#", "source": "Unknown", "reason": ""}
+_STORY_DEFAULTS = {"title": "Untitled", "url": "#", "source": "Unknown", "summary": ""}
+_NO_CATEGORIES = dict.fromkeys(CATEGORIES, ())
 
+# A reply wrapped in a markdown code fence, optionally tagged as json
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
 
-def categorize_and_summarize(
-    items: list[dict],
-    api_key: Optional[str] = None,
-    model: str = "claude-opus-4-6",
-) -> dict:
-    """
-    Send news items to Claude and get back:
-    - executive_summary: str
-    - top_stories: list of {title, url, source, reason}
-    - categories: dict of category_name -> list of {title, url, source, summary}
+# Message Batches polling: back off from 5s to 60s, give up after 20 minutes
+_BATCH_POLL_INITIAL = 5.0
+_BATCH_POLL_MAX = 60.0
+_BATCH_TIMEOUT = 20 * 60
 
-    Returns a structured dict ready for the email template.
-    """
-    if not items:
-        logger.warning("No news items to summarize.")
-        return _empty_result()
 
-    key = api_key or os.environ.get("ANTHROPIC_API_KEY")
-    if not key:
-        raise ValueError("ANTHROPIC_API_KEY is not set.")
+def _build_news_text(items: list[NewsItem], max_items: int = _MAX_ITEMS_PER_CALL) -> str:
+    """Format news items into a compact text block for the prompt."""
+    return "\n".join([
+        f"[{i}] SOURCE: {item.source}\n"
+        f"    TITLE: {item.title}\n"
+        f"    URL: {item.url}\n"
+        f"    SUMMARY: {item.summary[:300]}\n"
+        for i, item in enumerate(items[:max_items], 1)
+    ])
 
-    client = anthropic.Anthropic(api_key=key)
-    news_text = _build_news_text(items)
-    categories_list = "\n".join(f"- {c}: {CATEGORY_DESCRIPTIONS[c]}" for c in CATEGORIES)
 
-    prompt = f"""You are an expert AI/tech journalist creating a weekly briefing.
+# Static instructions shared by every run; only the news items change, so the
+# prompt is built once at import.
+_CATEGORIES_LIST = "\n".join(f"- {c}: {CATEGORY_DESCRIPTIONS[c]}" for c in CATEGORIES)
 
-Below are {len(items)} news items from the past 7 days across AI and technology.
+SYSTEM_PROMPT = f"""You are an expert AI/tech journalist creating a weekly briefing.
 
-NEWS ITEMS:
-{news_text}
+You will be given a numbered list of news items from the past 7 days across AI and technology.
 
 TASK:
 Analyze these stories and return a JSON object with EXACTLY this structure:
@@ -116,64 +123,309 @@ RULES:
 - Return ONLY valid JSON, no markdown fences, no extra text
 
 Categories:
-{categories_list}
+{_CATEGORIES_LIST}
 """
 
-    logger.info("Calling Claude API (%s) to analyze %d stories…", model, len(items))
+NEWS_PROMPT_TEMPLATE = "Below are {n_items} news items from the past 7 days.\n\nNEWS ITEMS:\n{news_text}"
+
+# Second pass when the items were summarised in several requests: choose the
+# overall top stories and write one executive summary from the partial results.
+MERGE_SYSTEM_PROMPT = """You are an expert AI/tech journalist finishing a weekly briefing.
+
+The week's news was analyzed in several batches. You will be given a JSON object with each batch's executive summary ("batch_summaries") and each batch's candidate top stories ("candidates").
+
+TASK:
+Return a JSON object with EXACTLY this structure:
+
+{
+  "executive_summary": "A 3-5 sentence executive summary of the most important AI and tech developments this week. Be concrete and specific.",
+  "top_stories": [
+    {
+      "title": "exact title from the candidates",
+      "url": "exact url from the candidates",
+      "source": "exact source from the candidates",
+      "reason": "1-2 sentences explaining why this is a top story"
+    }
+  ]
+}
+
+RULES:
+- top_stories: pick the 5 most important/impactful stories among the candidates
+- The executive summary must cover the whole week, not a single batch
+- Return ONLY valid JSON, no markdown fences, no extra text
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(api_key: str) -> "anthropic.Anthropic":
+    """One client (and HTTP connection pool) per API key for the process."""
+    # The SDK takes most of a second to import, so load it only once a
+    # request is actually about to be made
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def _create_message_batched(client: "anthropic.Anthropic", params: dict):
+    """
+    Run a single messages request through the Message Batches API and wait for
+    it to finish. Returns the Message, or None if the batch did not succeed in
+    time so the caller can fall back to a synchronous request.
+    """
+    import anthropic
+
+    batch = client.messages.batches.create(
+        requests=[{"custom_id": "weekly-briefing", "params": params}]
+    )
+    logger.info("Submitted message batch %s; waiting for results…", batch.id)
+
+    deadline = time.monotonic() + _BATCH_TIMEOUT
+    delay = _BATCH_POLL_INITIAL
+    while batch.processing_status != "ended":
+        if time.monotonic() + delay > deadline:
+            logger.warning(
+                "Message batch %s still %s after %ds; cancelling.",
+                batch.id, batch.processing_status, _BATCH_TIMEOUT,
+            )
+            try:
+                client.messages.batches.cancel(batch.id)
+            except anthropic.APIError as exc:
+                logger.debug("Could not cancel batch %s: %s", batch.id, exc)
+            return None
+        time.sleep(delay)
+        delay = min(delay * 2, _BATCH_POLL_MAX)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            return entry.result.message
+        logger.warning(
+            "Message batch %s request %s did not succeed: %s",
+            batch.id, entry.custom_id, entry.result.type,
+        )
+    return None
+
+
+def _request_json(
+    client: "anthropic.Anthropic",
+    system_text: str,
+    user_text: str,
+    model: str,
+    prompt_cache: bool,
+    batch: bool,
+) -> dict:
+    """Make one Claude request and parse its JSON reply (raises json.JSONDecodeError)."""
+    system_block = {"type": "text", "text": system_text}
+    user_block = {"type": "text", "text": user_text}
+    if prompt_cache:
+        # The instructions alone are below the model's minimum cacheable
+        # length, so the breakpoint goes after the news block and caches the
+        # whole prompt
+        user_block["cache_control"] = {"type": "ephemeral"}
+
+    params = {
+        "model": model,
+        "max_tokens": 8192,
+        "temperature": 0,
+        "system": [system_block],
+        "messages": [{"role": "user", "content": [user_block]}],
+    }
+    message = _create_message_batched(client, params) if batch else None
+    if message is None:
+        message = client.messages.create(**params)
+    usage = message.usage
+    logger.debug(
+        "Claude usage: input=%s cache_read=%s cache_write=%s output=%s",
+        usage.input_tokens,
+        getattr(usage, "cache_read_input_tokens", None),
+        getattr(usage, "cache_creation_input_tokens", None),
+        usage.output_tokens,
+    )
+    raw = message.content[0].text.strip()
+    logger.debug("Claude raw response length: %d chars", len(raw))
+
+    # Strip any accidental markdown fences
+    fenced = _FENCE_RE.match(raw)
+    if fenced:
+        raw = fenced.group(1)
+
     try:
-        message = client.messages.create(
-            model=model,
-            max_tokens=8192,
-            messages=[{"role": "user", "content": prompt}],
+        return _parse_json_object(raw)
+    except json.JSONDecodeError:
+        logger.debug("Raw response: %s", raw[:500])
+        raise
+
+
+def _summarize_in_chunks(client: "anthropic.Anthropic", items: list[NewsItem], **request_kw) -> dict:
+    """
+    Summarize more items than fit in one request: split them into even
+    chunks of at most _MAX_ITEMS_PER_CALL, summarize the chunks concurrently,
+    merge their categories, then ask once more for the overall top stories
+    and executive summary.
+
+    A chunk that fails is logged and left out as long as another chunk
+    succeeded; if none did, the first chunk's error is raised.
+    """
+    import anthropic
+
+    n_chunks = -(-len(items) // _MAX_ITEMS_PER_CALL)
+    size = -(-len(items) // n_chunks)
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    logger.info("Splitting %d stories into %d parallel requests…", len(items), len(chunks))
+
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        futures = [
+            executor.submit(
+                _request_json, client, SYSTEM_PROMPT,
+                NEWS_PROMPT_TEMPLATE.format(n_items=len(chunk), news_text=_build_news_text(chunk)),
+                **request_kw,
+            )
+            for chunk in chunks
+        ]
+        partials = []
+        errors = []
+        for i, future in enumerate(futures, 1):
+            try:
+                partials.append(future.result())
+            except (json.JSONDecodeError, anthropic.APIError) as exc:
+                logger.warning("Chunk %d/%d failed (%s); leaving its stories out.",
+                               i, len(chunks), exc)
+                errors.append(exc)
+    if not partials:
+        raise errors[0]
+
+    categories = {cat: [] for cat in CATEGORIES}
+    summaries = []
+    candidates = []
+    for partial in partials:
+        _validate_result(partial)
+        for cat, stories in partial["categories"].items():
+            categories.setdefault(cat, []).extend(stories)
+        summaries.append(partial["executive_summary"])
+        candidates.extend(partial["top_stories"])
+
+    merge_text = json.dumps(
+        {"batch_summaries": summaries, "candidates": candidates}, ensure_ascii=False, indent=1
+    )
+    # The merge request is small, so it always goes out synchronously: a second
+    # batch with its own deadline would break the run's overall time budget
+    try:
+        merged = _request_json(
+            client, MERGE_SYSTEM_PROMPT, merge_text, **{**request_kw, "batch": False}
         )
-        raw = message.content[0].text.strip()
-        logger.debug("Claude raw response length: %d chars", len(raw))
+    except (json.JSONDecodeError, anthropic.APIError) as exc:
+        logger.warning("Top-story merge failed (%s); using the first chunk's picks.", exc)
+        merged = {}
 
-        # Strip any accidental markdown fences
-        if raw.startswith("```"):
-            raw = raw.split("```", 2)[1]
-            if raw.startswith("json"):
-                raw = raw[4:]
-            raw = raw.rsplit("```", 1)[0].strip()
+    return {
+        "executive_summary": merged.get("executive_summary") or summaries[0],
+        "top_stories": merged.get("top_stories") or candidates[:5],
+        "categories": categories,
+    }
 
-        result = json.loads(raw)
+
+def categorize_and_summarize(
+    items: list[NewsItem],
+    api_key: Optional[str] = None,
+    model: str = DEFAULT_MODEL,
+    prompt_cache: bool = False,
+    batch: Optional[bool] = None,
+) -> dict:
+    """
+    Send news items to Claude and get back:
+    - executive_summary: str
+    - top_stories: list of {title, url, source, reason}
+    - categories: dict of category_name -> list of {title, url, source, summary}
+
+    Returns a structured dict ready for the email template.
+
+    With prompt_cache enabled, the prompt is written to the 5-minute prompt
+    cache so a rerun on the same stories soon after (a retry, or a dry run
+    followed by the real send) reads it back at a fraction of the price.
+    Cache writes cost more than plain input, so it is off by default: the
+    weekly run never hits a cache written a week earlier.
+
+    With batch enabled (default: BRIEFING_BATCH=1 in the environment), the
+    request goes through the Message Batches API, which is billed at half
+    price but may take minutes to complete. If the batch doesn't succeed
+    within 20 minutes it is cancelled and the request is sent synchronously.
+
+    More than _MAX_ITEMS_PER_CALL items are summarized in parallel chunks
+    plus a short merge request, rather than truncating the list.
+    """
+    if not items:
+        logger.warning("No news items to summarize.")
+        return _empty_result()
+
+    key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+    if not key:
+        raise ValueError("ANTHROPIC_API_KEY is not set.")
+
+    import anthropic
+
+    client = _get_client(key)
+    if batch is None:
+        batch = os.environ.get("BRIEFING_BATCH") == "1"
+    request_kw = {"model": model, "prompt_cache": prompt_cache, "batch": batch}
+
+    logger.info("Calling Claude API (%s) to analyze %d stories…", model, len(items))
+    try:
+        if len(items) > _MAX_ITEMS_PER_CALL:
+            result = _summarize_in_chunks(client, items, **request_kw)
+        else:
+            news_text = _build_news_text(items)
+            result = _request_json(
+                client, SYSTEM_PROMPT,
+                NEWS_PROMPT_TEMPLATE.format(n_items=len(items), news_text=news_text),
+                **request_kw,
+            )
         _validate_result(result)
         logger.info("Successfully parsed Claude response.")
         return result
 
     except json.JSONDecodeError as exc:
         logger.error("Failed to parse Claude JSON response: %s", exc)
-        logger.debug("Raw response: %s", raw[:500])
         return _fallback_result(items)
     except anthropic.APIError as exc:
         logger.error("Claude API error: %s", exc)
         raise
 
 
+def _parse_json_object(raw: str) -> dict:
+    """
+    Parse Claude's JSON reply. If there is stray text around the object
+    (a leftover fence, a sentence of preamble), retry on the outermost
+    {...} before giving up.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        return loads(raw)
+    except json.JSONDecodeError:
+        start, end = raw.find("{"), raw.rfind("}")
+        if start == -1 or end <= start:
+            raise
+        logger.debug("Retrying JSON parse on characters %d–%d", start, end)
+        return loads(raw[start:end + 1])
+
+
 def _validate_result(result: dict) -> None:
     """Basic validation / normalization of the Claude response."""
     if "executive_summary" not in result:
         result["executive_summary"] = "No summary available."
-    if "top_stories" not in result or not isinstance(result["top_stories"], list):
-        result["top_stories"] = []
-    if "categories" not in result or not isinstance(result["categories"], dict):
-        result["categories"] = {}
-    # Ensure all expected categories exist
-    for cat in CATEGORIES:
-        if cat not in result["categories"]:
-            result["categories"][cat] = []
-    # Ensure each story has required fields
-    for story in result.get("top_stories", []):
-        story.setdefault("title", "Untitled")
-        story.setdefault("url", "#")
-        story.setdefault("source", "Unknown")
-        story.setdefault("reason", "")
-    for cat_items in result["categories"].values():
-        for story in cat_items:
-            story.setdefault("title", "Untitled")
-            story.setdefault("url", "#")
-            story.setdefault("source", "Unknown")
-            story.setdefault("summary", "")
+    top_stories = result.get("top_stories")
+    if not isinstance(top_stories, list):
+        top_stories = []
+    categories = result.get("categories")
+    if not isinstance(categories, dict):
+        categories = {}
+
+    # Fill in missing story fields, and make sure every expected category
+    # exists (in the canonical order; unexpected ones are kept after them)
+    result["top_stories"] = [{**_TOP_STORY_DEFAULTS, **story} for story in top_stories]
+    result["categories"] = {
+        cat: [{**_STORY_DEFAULTS, **story} for story in stories or ()]
+        for cat, stories in {**_NO_CATEGORIES, **categories}.items()
+    }
 
 
 def _empty_result() -> dict:
@@ -184,16 +436,16 @@ def _empty_result() -> dict:
     }
 
 
-def _fallback_result(items: list[dict]) -> dict:
+def _fallback_result(items: list[NewsItem]) -> dict:
     """Best-effort fallback if Claude response can't be parsed."""
     logger.warning("Using fallback result — Claude response could not be parsed.")
     categories = {cat: [] for cat in CATEGORIES}
     categories["Other AI & Tech News"] = [
         {
-            "title": item["title"],
-            "url": item["url"],
-            "source": item["source"],
-            "summary": item["summary"],
+            "title": item.title,
+            "url": item.url,
+            "source": item.source,
+            "summary": item.summary,
         }
         for item in items[:40]
     ]
@@ -204,10 +456,10 @@ def _fallback_result(items: list[dict]) -> dict:
         ),
         "top_stories": [
             {
-                "title": item["title"],
-                "url": item["url"],
-                "source": item["source"],
-                "reason": item["summary"][:150],
+                "title": item.title,
+                "url": item.url,
+                "source": item.source,
+                "reason": item.summary[:150],
             }
             for item in items[:5]
         ],